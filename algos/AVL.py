@@ -1,94 +1,72 @@
 import tkinter as tk
 from tkinter import messagebox
-from time import perf_counter, sleep
-
-# ---------------- NODE STRUCTURE ----------------
-class Node:
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
-        self.height = 1
-
-# ---------------- AVL TREE LOGIC ----------------
-class AVLTree:
-    def insert(self, root, key, canvas=None, draw_callback=None, speed=1.0, highlight_node=None):
-        """Insert key into AVL tree with optional visualization callbacks."""
-        if not root:
-            if draw_callback:
-                draw_callback(f"Inserting {key}")
-                sleep(1.0 / speed)
-            return Node(key)
-
-        if key < root.key:
-            root.left = self.insert(root.left, key, canvas, draw_callback, speed, highlight_node)
-        elif key > root.key:
-            root.right = self.insert(root.right, key, canvas, draw_callback, speed, highlight_node)
-        else:
-            return root  # Duplicate keys not allowed
-
-        # Update height
-        root.height = 1 + max(self.getHeight(root.left), self.getHeight(root.right))
-        balance = self.getBalance(root)
-
-        # Balancing cases
-        if balance > 1 and key < root.left.key:
-            if draw_callback:
-                draw_callback(f"LL Rotation at {root.key}", root)
-                sleep(1.0 / speed)
-            return self.rightRotate(root)
-
-        if balance < -1 and key > root.right.key:
-            if draw_callback:
-                draw_callback(f"RR Rotation at {root.key}", root)
-                sleep(1.0 / speed)
-            return self.leftRotate(root)
-
-        if balance > 1 and key > root.left.key:
-            if draw_callback:
-                draw_callback(f"LR Rotation at {root.key}", root)
-                sleep(1.0 / speed)
-            root.left = self.leftRotate(root.left)
-            return self.rightRotate(root)
-
-        if balance < -1 and key < root.right.key:
-            if draw_callback:
-                draw_callback(f"RL Rotation at {root.key}", root)
-                sleep(1.0 / speed)
-            root.right = self.rightRotate(root.right)
-            return self.leftRotate(root)
-
-        if draw_callback:
-            draw_callback(f"Inserting {key}", root)
-            sleep(1.0 / speed)
-        return root
-
-    # Rotation helpers
-    def leftRotate(self, z):
-        y = z.right
-        T2 = y.left
-        y.left = z
-        z.right = T2
-        z.height = 1 + max(self.getHeight(z.left), self.getHeight(z.right))
-        y.height = 1 + max(self.getHeight(y.left), self.getHeight(y.right))
-        return y
-
-    def rightRotate(self, z):
-        y = z.left
-        T3 = y.right
-        y.right = z
-        z.left = T3
-        z.height = 1 + max(self.getHeight(z.left), self.getHeight(z.right))
-        y.height = 1 + max(self.getHeight(y.left), self.getHeight(y.right))
-        return y
-
-    def getHeight(self, node):
-        return 0 if not node else node.height
-
-    def getBalance(self, node):
-        return 0 if not node else self.getHeight(node.left) - self.getHeight(node.right)
+from time import perf_counter
+
+if __package__:
+    from .avl_tree import AVLTree, Node, PersistentAVLTree
+else:  # run as a script, e.g. python algos/AVL.py
+    from avl_tree import AVLTree, Node, PersistentAVLTree
 
 # ---------------- VISUALIZATION ----------------
+class RecordingAVLTree(PersistentAVLTree):
+    """Persistent AVL tree that records structural events while inserting.
+
+    Each event is (kind, message, root, highlight_key) where root is an
+    immutable snapshot to display: "insert" shows the new leaf attached
+    before any rebalancing, "rotate" marks the pivot on that same tree and
+    "balanced" shows the tree after the rotation.
+    """
+
+    def __init__(self):
+        PersistentAVLTree.__init__(self)
+        self.events = []
+        self.rotations = []
+
+    def insert(self, root, key):
+        attached = self._attach(root, key)
+        if attached is root:
+            self.events.append(("duplicate", f"{key} is already in the tree", root, key))
+            return root
+        self.events.append(("insert", f"Inserting {key}", attached, key))
+
+        self.rotations = []
+        new_root = PersistentAVLTree.insert(self, root, key)
+        for kind, pivot in self.rotations:
+            self.events.append(("rotate", f"{kind} Rotation at {pivot}", attached, pivot))
+            self.events.append(("balanced", f"{kind} Rotation at {pivot} done", new_root, None))
+        return new_root
+
+    def rebalance(self, node):
+        balance = self.getBalance(node)
+        if balance > 1:
+            self.rotations.append(("LR" if self.getBalance(node.left) < 0 else "LL", node.key))
+        elif balance < -1:
+            self.rotations.append(("RL" if self.getBalance(node.right) > 0 else "RR", node.key))
+        return PersistentAVLTree.rebalance(self, node)
+
+    def _attach(self, root, key):
+        # Plain BST insert with path copying and no rebalancing
+        path = []
+        node = root
+        while node:
+            if key == node.key:
+                return root
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        subtree = Node(key)
+        for node in reversed(path):
+            node = self.copy(node)
+            if key < node.key:
+                node.left = subtree
+            else:
+                node.right = subtree
+            node.height = 1 + max(self.getHeight(node.left), self.getHeight(node.right))
+            node.size = 1 + self.getSize(node.left) + self.getSize(node.right)
+            subtree = node
+        return subtree
+
+
 class AVLVisualizer:
     def __init__(self, root):
         self.root = root
@@ -96,6 +74,8 @@ class AVLVisualizer:
         self.tree = AVLTree()
         self.root_node = None
         self.speed = tk.DoubleVar(value=1.0)
+        self.job = None
+        self.reset_drawing()
 
         # Canvas
         self.canvas = tk.Canvas(root, width=950, height=550, bg="#1e1e1e")
@@ -122,46 +102,90 @@ class AVLVisualizer:
         self.final_list_label = tk.Label(root, text="", fg="#00bfff", bg="#1e1e1e", font=("Arial", 12))
         self.final_list_label.pack()
 
-    # Recursive draw
-    def draw_tree(self, node=None, highlight_node=None, x=475, y=60, dx=180):
-        self.canvas.delete("all")
+    # Incremental drawing: canvas items are kept per key and only the ones whose
+    # position, balance factor or colour changed are touched. Snapshots come
+    # from a persistent tree, so a subtree that is the same Node object at the
+    # same place as last frame is identical and is skipped entirely.
+    def reset_drawing(self):
+        self.nodes = {}      # key -> (oval, label, bf_label)
+        self.edges = {}      # child key -> line from its parent
+        self.placed = {}     # key -> (node object, x, y, dx) as last drawn
+        self.balance = {}    # key -> balance factor as last drawn
+        self.highlighted = None
+
+    def render(self, node, highlight_key=None):
+        # Keys are never removed in this visualizer, so no node items need deleting
         if node:
-            self._draw(node, x, y, dx, highlight_node)
+            self._render(node, 475, 60, 180, None)
+        if self.highlighted != highlight_key:
+            self.set_fill(self.highlighted, False)
+            self.set_fill(highlight_key, True)
+            self.highlighted = highlight_key
+
+    def _render(self, node, x, y, dx, parent_xy):
+        key = node.key
+        self.place_edge(key, parent_xy, x, y)
+        if self.placed.get(key) == (node, x, y, dx):
+            return  # Same shared subtree at the same place: nothing changed
+
+        if key in self.nodes:
+            oval, label, bf_label = self.nodes[key]
+            if self.placed[key][1:3] != (x, y):
+                self.canvas.coords(oval, x - 20, y - 20, x + 20, y + 20)
+                self.canvas.coords(label, x, y)
+                self.canvas.coords(bf_label, x, y + 30)
+        else:
+            oval = self.canvas.create_oval(x - 20, y - 20, x + 20, y + 20, fill="#4a90e2", outline="white", width=2)
+            label = self.canvas.create_text(x, y, text=str(key), fill="white", font=("Helvetica", 14, "bold"))
+            bf_label = self.canvas.create_text(x, y + 30, text="", fill="#ffcc00", font=("Arial", 10))
+            self.nodes[key] = (oval, label, bf_label)
+        self.placed[key] = (node, x, y, dx)
 
-    def _draw(self, node, x, y, dx, highlight_node):
-        if node.left:
-            self.canvas.create_line(x, y, x - dx, y + 80, fill="white", width=2)
-            self._draw(node.left, x - dx, y + 80, dx / 1.6, highlight_node)
-        if node.right:
-            self.canvas.create_line(x, y, x + dx, y + 80, fill="white", width=2)
-            self._draw(node.right, x + dx, y + 80, dx / 1.6, highlight_node)
-
-        # Node color highlighting
-        fill_color = "#4a90e2"
-        outline_color = "white"
-        if highlight_node and node.key == highlight_node.key:
-            fill_color = "#ff4444"  # red for rotation
-            outline_color = "#ffcc00"
-
-        self.canvas.create_oval(x - 20, y - 20, x + 20, y + 20, fill=fill_color, outline=outline_color, width=2)
-        self.canvas.create_text(x, y, text=str(node.key), fill="white", font=("Helvetica", 14, "bold"))
         bf = self.tree.getBalance(node)
-        self.canvas.create_text(x, y + 30, text=f"BF={bf}", fill="#ffcc00", font=("Arial", 10))
+        if self.balance.get(key) != bf:
+            self.canvas.itemconfig(bf_label, text=f"BF={bf}")
+            self.balance[key] = bf
 
-    # Callback for drawing + messages
-    def draw_callback(self, msg=None, highlight_node=None):
-        if msg:
-            self.info_label.config(text=msg)
-        self.draw_tree(self.root_node, highlight_node)
-        self.root.update()
+        if node.left:
+            self._render(node.left, x - dx, y + 80, dx / 1.6, (x, y))
+        if node.right:
+            self._render(node.right, x + dx, y + 80, dx / 1.6, (x, y))
+
+    def place_edge(self, key, parent_xy, x, y):
+        line = self.edges.get(key)
+        if parent_xy is None:
+            if line is not None:
+                self.canvas.delete(line)
+                del self.edges[key]
+            return
+        coords = (*parent_xy, x, y)
+        if line is None:
+            line = self.canvas.create_line(*coords, fill="white", width=2)
+            self.canvas.tag_lower(line)  # keep edges beneath the nodes
+            self.edges[key] = line
+        elif tuple(self.canvas.coords(line)) != coords:
+            self.canvas.coords(line, *coords)
+
+    def set_fill(self, key, highlighted):
+        if key not in self.nodes:
+            return
+        oval = self.nodes[key][0]
+        if highlighted:
+            self.canvas.itemconfig(oval, fill="#ff4444", outline="#ffcc00")  # red for rotation
+        else:
+            self.canvas.itemconfig(oval, fill="#4a90e2", outline="white")
 
     # Insert list of nodes
     def insert_list(self):
         # Clear previous results
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
         self.info_label.config(text="")
         self.time_label.config(text="")
         self.final_list_label.config(text="")
         self.canvas.delete("all")
+        self.reset_drawing()
         self.root_node = None
 
         raw_input = self.entry.get().strip()
@@ -184,37 +208,34 @@ class AVLVisualizer:
         actual_time_ms = (end_algo - start_algo) * 1000
         print(f"Actual AVL Algorithm Time (no animation): {actual_time_ms:.3f} ms")
 
-        # Now perform visualized insertions
-        self.root_node = None
+        # Record the structural events once, then replay them with root.after
+        recorder = RecordingAVLTree()
         for k in keys:
-            self.info_label.config(text=f"Inserting {k} ...")
-            self.root_node = self.tree.insert(
-                self.root_node, k, self.canvas, self.draw_callback, self.speed.get()
-            )
-            self.draw_tree(self.root_node)
-            self.root.update()
-
-        # Compute final AVL tree list (level order)
-        final_list = self.level_order(self.root_node)
-        self.info_label.config(text="All insertions complete.")
+            self.root_node = recorder.insert(self.root_node, k)
+        events = iter(recorder.events)
         self.time_label.config(text=f"Actual AVL Algorithm Time: {actual_time_ms:.3f} ms")
-        self.final_list_label.config(text=f"Final AVL Tree (Level Order): {final_list}")
+
+        def play():
+            event = next(events, None)
+            if event is None:
+                self.job = None
+                self.render(self.root_node)
+                # Compute final AVL tree list (level order)
+                final_list = self.level_order(self.root_node)
+                self.info_label.config(text="All insertions complete.")
+                self.final_list_label.config(text=f"Final AVL Tree (Level Order): {final_list}")
+                return
+            kind, message, snapshot, highlight_key = event
+            self.info_label.config(text=message)
+            self.render(snapshot, highlight_key if kind == "rotate" else None)
+            self.job = self.root.after(int(1000 / self.speed.get()), play)
+
         self.entry.delete(0, "end")
+        play()
 
     # Level order traversal
     def level_order(self, root):
-        if not root:
-            return []
-        queue = [root]
-        result = []
-        while queue:
-            node = queue.pop(0)
-            result.append(node.key)
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        return result
+        return list(self.tree.levelOrder(root))
 
 # ---------------- MAIN ----------------
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 import tkinter as tk
 from time import perf_counter
 
+if __package__:
+    from .string_search import compile as compile_pattern, compute_lps
+else:  # run as a script, e.g. python algos/KMP.py
+    from string_search import compile as compile_pattern, compute_lps
+
 class KMPVisualizer:
+    VIEW_CHARS = 36   # characters visible on the canvas at once
+    CELL = 25         # horizontal spacing of characters in pixels
+    FAST_BATCH = 500  # trace events replayed per timer tick in fast-forward mode
+
     def __init__(self, root):
         self.root = root
+        self.job = None
         self.root.title("KMP String Search Visualization")
         self.root.configure(bg="#1e1e1e")
 
@@ -25,6 +35,10 @@ class KMPVisualizer:
         tk.Button(root, text="Start Visualization", command=self.start_visualization, bg="#00ADB5", fg="blue",
                   font=("Helvetica", 12, "bold")).pack(pady=10)
 
+        self.fast_forward = tk.BooleanVar(value=False)
+        tk.Checkbutton(root, text="Fast forward", variable=self.fast_forward, fg="white", bg="#1e1e1e",
+                       selectcolor="#2e2e2e", activebackground="#1e1e1e", font=("Helvetica", 11)).pack()
+
         # Canvas
         self.canvas = tk.Canvas(root, width=1000, height=300, bg="#2e2e2e", highlightthickness=0)
         self.canvas.pack(pady=10)
@@ -50,21 +64,7 @@ class KMPVisualizer:
             tk.Label(legend_frame, text=f"{icon} {text}", fg=color, bg="#1e1e1e", font=("Helvetica", 11)).pack(side="left", padx=15)
 
     def compute_lps(self, pattern):
-        lps = [0] * len(pattern)
-        length = 0
-        i = 1
-        while i < len(pattern):
-            if pattern[i] == pattern[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
-        return lps
+        return compute_lps(pattern)
 
     def start_visualization(self):
         text = self.text_entry.get()
@@ -73,6 +73,9 @@ class KMPVisualizer:
             self.result_label.config(text="Please enter both text and pattern.", fg="red")
             return
 
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
         self.canvas.delete("all")
         self.result_label.config(text="")
         self.visualize_kmp(text, pattern)
@@ -84,108 +87,123 @@ class KMPVisualizer:
         end_algo = perf_counter()
         algo_time = (end_algo - start_algo) * 1000
 
-        # Now start visualization
-        lps = self.compute_lps(pattern)
-        self.lps_label.config(text=f"LPS: {lps}")
+        # Now start visualization (the LPS table comes from the compiled-pattern cache)
+        compiled = compile_pattern(pattern)
+        self.lps_label.config(text=f"LPS: {list(compiled.lps)}")
 
+        canvas = self.canvas
+        view, cell, m = self.VIEW_CHARS, self.CELL, len(pattern)
         x_start = 50
         y_text = 100
         y_pattern = 160
 
-        text_labels = []
-        for i, ch in enumerate(text):
-            lbl = self.canvas.create_text(x_start + i * 25, y_text, text=ch, fill="white", font=("Helvetica", 14, "bold"))
-            text_labels.append(lbl)
-
-        pattern_labels = []
-        for i, ch in enumerate(pattern):
-            lbl = self.canvas.create_text(x_start + i * 25, y_pattern, text=ch, fill="gray", font=("Helvetica", 14, "bold"))
-            pattern_labels.append(lbl)
-
-        self.root.update()
-
-        i = j = 0
-        delay = 500
-        comparisons_visual = 0
+        # Only one row of VIEW_CHARS items exists per line; scrolling rewrites their text
+        text_labels = [canvas.create_text(x_start + k * cell, y_text, text="", fill="white",
+                                          font=("Helvetica", 14, "bold")) for k in range(view)]
+        pattern_labels = [canvas.create_text(x_start + k * cell, y_pattern, text="", fill="gray",
+                                             font=("Helvetica", 14, "bold")) for k in range(view)]
+        window_label = canvas.create_text(x_start - 10, 50, text="", fill="#888888", anchor="w",
+                                          font=("Helvetica", 10))
+
+        colors = {}          # text index -> colour, for coloured characters at or right of the view
+        pattern_colored = []  # pattern slots recoloured by the previous event
+        view_start = -1
+        pattern_shift = None
         matches_found = []
-
-        def step():
-            nonlocal i, j, comparisons_visual, matches_found
-
-            if i < len(text):
-                comparisons_visual += 1
-
-                # Reset pattern colors
-                for lbl in pattern_labels:
-                    self.canvas.itemconfig(lbl, fill="gray")
-
-                # Highlight current char in text
-                self.canvas.itemconfig(text_labels[i], fill="#FFA500")  # orange
-
-                # If match
-                if text[i] == pattern[j]:
-                    self.canvas.itemconfig(text_labels[i], fill="#00FF00")
-                    self.canvas.itemconfig(pattern_labels[j], fill="#00FF00")
-                    i += 1
-                    j += 1
+        events = compiled.trace(text)
+
+        def scroll_to(i):
+            nonlocal view_start, pattern_shift
+            if 0 <= view_start <= i < view_start + view:
+                return
+            view_start = max(0, min(i - view // 4, len(text) - view))
+            for pos in [pos for pos in colors if pos < view_start]:
+                del colors[pos]  # the search never moves left again
+            for k, lbl in enumerate(text_labels):
+                pos = view_start + k
+                if pos < len(text):
+                    canvas.itemconfig(lbl, text=text[pos], fill=colors.get(pos, "white"))
                 else:
-                    self.canvas.itemconfig(pattern_labels[j], fill="#FF4444")
-                    if j != 0:
-                        j = lps[j - 1]
-                    else:
-                        i += 1
-
-                # Full pattern match
-                if j == len(pattern):
-                    start_index = i - j
-                    matches_found.append(start_index)
-
-                    # Highlight match in purple
-                    for k in range(len(pattern)):
-                        self.canvas.itemconfig(text_labels[start_index + k], fill="#B366FF")
-                        self.canvas.itemconfig(pattern_labels[k], fill="#B366FF")
-
-                    j = lps[j - 1]  # Continue searching
-
-                self.root.after(delay, step)
+                    canvas.itemconfig(lbl, text="")
+            canvas.itemconfig(window_label, text=f"text[{view_start}:{min(view_start + view, len(text))}] "
+                                                 f"of {len(text)} characters")
+            pattern_shift = None
+
+        def place_pattern(shift):
+            # Align pattern[0] under text[shift]
+            nonlocal pattern_shift
+            if shift == pattern_shift:
+                for k in pattern_colored:
+                    canvas.itemconfig(pattern_labels[k], fill="gray")
+            else:
+                pattern_shift = shift
+                for k, lbl in enumerate(pattern_labels):
+                    p = view_start + k - shift
+                    canvas.itemconfig(lbl, text=pattern[p] if 0 <= p < m else "", fill="gray")
+            pattern_colored.clear()
+
+        def paint_text(pos, color):
+            colors[pos] = color
+            k = pos - view_start
+            if 0 <= k < view:
+                canvas.itemconfig(text_labels[k], fill=color)
+
+        def paint_pattern(p, color):
+            k = pattern_shift + p - view_start
+            if 0 <= k < view:
+                canvas.itemconfig(pattern_labels[k], fill=color)
+                pattern_colored.append(k)
+
+        def apply(event):
+            kind, a, b = event
+            if kind == "found":
+                matches_found.append(a)
+                # Highlight match in purple
+                place_pattern(a)
+                for k in range(m):
+                    paint_text(a + k, "#B366FF")
+                    paint_pattern(k, "#B366FF")
+                return
+
+            i, j = a, b
+            scroll_to(i)
+            place_pattern(i - j)
+            if kind == "match":
+                paint_text(i, "#00FF00")
+                paint_pattern(j, "#00FF00")
+            else:
+                paint_text(i, "#FFA500")  # orange
+                paint_pattern(j, "#FF4444")
 
+        def step():
+            batch = self.FAST_BATCH if self.fast_forward.get() else 1
+            for _ in range(batch):
+                event = next(events, None)
+                if event is None:
+                    finish()
+                    return
+                apply(event)
+            self.job = self.root.after(1 if batch > 1 else delay, step)
+
+        def finish():
+            self.job = None
+            if matches_found:
+                self.result_label.config(
+                    text=f"✅ Pattern found at indices: {matches_found}\n⏱ Time: {algo_time:.3f} ms\n🔁 Comparisons: {comparisons}",
+                    fg="#B366FF"
+                )
             else:
-                if matches_found:
-                    self.result_label.config(
-                        text=f"✅ Pattern found at indices: {matches_found}\n⏱ Time: {algo_time:.3f} ms\n🔁 Comparisons: {comparisons}",
-                        fg="#B366FF"
-                    )
-                else:
-                    self.result_label.config(
-                        text=f"❌ Pattern not found\n⏱ Time: {algo_time:.3f} ms\n🔁 Comparisons: {comparisons}",
-                        fg="#FF4444"
-                    )
+                self.result_label.config(
+                    text=f"❌ Pattern not found\n⏱ Time: {algo_time:.3f} ms\n🔁 Comparisons: {comparisons}",
+                    fg="#FF4444"
+                )
 
-        self.root.after(delay, step)
+        delay = 500
+        scroll_to(0)
+        self.job = self.root.after(delay, step)
 
     def kmp_algorithm(self, text, pattern):
-        lps = self.compute_lps(pattern)
-        i = j = comparisons = 0
-        matches = []
-
-        while i < len(text):
-            comparisons += 1
-
-            if text[i] == pattern[j]:
-                i += 1
-                j += 1
-
-            if j == len(pattern):
-                matches.append(i - j)
-                j = lps[j - 1]  # continue searching
-
-            elif i < len(text) and text[i] != pattern[j]:
-                if j != 0:
-                    j = lps[j - 1]
-                else:
-                    i += 1
-
-        return matches, comparisons
+        return compile_pattern(pattern).search(text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""Headless algorithm library: KMP string search, AVL trees and graph coloring.
+
+Nothing here imports tkinter. Submodules are loaded on first use, so
+``import algos`` is nearly free and a worker only pays for what it touches:
+
+    from algos import KMPPattern        # loads algos.string_search only
+    algos.coloring.dsatur_coloring(...)
+
+KMP.py, AVL.py and graph_colouring.py are the Tk visualizers built on top.
+"""
+import importlib
+
+__all__ = ["string_search", "avl_tree", "coloring"]
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "compute_lps": "string_search",
+    "KMPPattern": "string_search",
+    "compile": "string_search",
+    "kmp_stream": "string_search",
+    "kmp_search_batch": "string_search",
+    "kmp_parallel": "string_search",
+    "kmp_parallel_file": "string_search",
+    "AhoCorasick": "string_search",
+    "AVLTree": "avl_tree",
+    "PersistentAVLTree": "avl_tree",
+    "ConcurrentAVLTree": "avl_tree",
+    "ArrayAVLTree": "avl_tree",
+    "MappedAVL": "avl_tree",
+    "CSRGraph": "coloring",
+    "greedy_coloring": "coloring",
+    "welsh_powell_coloring": "coloring",
+    "smallest_last_coloring": "coloring",
+    "dsatur_coloring": "coloring",
+    "backtracking_coloring": "coloring",
+    "exact_coloring": "coloring",
+    "parallel_backtracking_coloring": "coloring",
+    "DynamicColoring": "coloring",
+}
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_EXPORTS))
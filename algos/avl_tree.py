@@ -0,0 +1,916 @@
+"""AVL trees without any GUI dependency.
+
+In-place, persistent (path-copying), concurrent and array-backed trees with
+order statistics, bulk operations and memory-mapped snapshots. AVL.py
+visualizes them.
+"""
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+__all__ = [
+    "Node", "AVLTree", "PersistentAVLTree", "ConcurrentAVLTree", "ArrayAVLTree", "SNAPSHOT_MAGIC",
+    "SNAPSHOT_VERSION", "SNAPSHOT_HEADER", "MappedAVL",
+]
+
+# ---------------- NODE STRUCTURE ----------------
+class Node:
+    __slots__ = ("key", "left", "right", "height", "size")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1  # number of keys in this subtree
+
+# ---------------- AVL TREE LOGIC ----------------
+class AVLTree:
+    def insert(self, root, key):
+        """Insert key into AVL tree and return the new root (iterative, no callbacks)."""
+        if not root:
+            return Node(key)
+
+        # Walk down, remembering the path
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return root  # Duplicate keys not allowed
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = Node(key)
+        else:
+            parent.right = Node(key)
+        for node in path:
+            node.size += 1
+
+        # Walk back up updating heights; one rebalance fixes the whole tree
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            left_h = node.left.height if node.left else 0
+            right_h = node.right.height if node.right else 0
+            if left_h - right_h > 1 or right_h - left_h > 1:
+                subtree = self.rebalance(node)
+                if idx == 0:
+                    return subtree
+                above = path[idx - 1]
+                if above.left is node:
+                    above.left = subtree
+                else:
+                    above.right = subtree
+                break
+            height = 1 + (left_h if left_h > right_h else right_h)
+            if height == node.height:
+                break  # Nothing above can change
+            node.height = height
+        return root
+
+    def rebalance(self, node):
+        """Fix the height and size of node and apply the LL/RR/LR/RL rotation it needs."""
+        node.height = 1 + max(self.getHeight(node.left), self.getHeight(node.right))
+        node.size = 1 + self.getSize(node.left) + self.getSize(node.right)
+        balance = self.getBalance(node)
+        if balance > 1:
+            if self.getBalance(node.left) < 0:
+                node.left = self.leftRotate(node.left)
+            return self.rightRotate(node)
+        if balance < -1:
+            if self.getBalance(node.right) > 0:
+                node.right = self.rightRotate(node.right)
+            return self.leftRotate(node)
+        return node
+
+    def fromKeys(self, keys):
+        """Bulk-load: sort and deduplicate keys, then build the tree in linear time."""
+        return self.buildSorted(sorted(set(keys)))
+
+    def buildSorted(self, keys):
+        """Build a height-balanced tree from strictly increasing keys in O(n)."""
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = Node(keys[mid])
+            left = node.left = build(lo, mid)
+            right = node.right = build(mid + 1, hi)
+            left_h = left.height if left else 0
+            right_h = right.height if right else 0
+            node.height = 1 + (left_h if left_h > right_h else right_h)
+            node.size = hi - lo
+            return node
+
+        return build(0, len(keys))
+
+    def insertMany(self, root, keys):
+        """Fold a batch of keys into the tree.
+
+        Small batches are inserted one by one; large ones are merged with the
+        tree's sorted keys and the result is rebuilt in O(n + m).
+        """
+        batch = sorted(set(keys))
+        if len(batch) * self.getHeight(root) < self.getSize(root):
+            for key in batch:
+                root = self.insert(root, key)
+            return root
+
+        existing = list(self.inorder(root))
+        merged = []
+        i = j = 0
+        while i < len(existing) and j < len(batch):
+            if existing[i] < batch[j]:
+                merged.append(existing[i])
+                i += 1
+            elif existing[i] > batch[j]:
+                merged.append(batch[j])
+                j += 1
+            else:
+                merged.append(existing[i])
+                i += 1
+                j += 1
+        merged.extend(existing[i:])
+        merged.extend(batch[j:])
+        return self.buildSorted(merged)
+
+    # Lazy traversals: extra memory is bounded by the tree height (level order: its widest level)
+    def inorder(self, root):
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def levelOrder(self, root):
+        queue = deque([root] if root else [])
+        while queue:
+            node = queue.popleft()
+            yield node.key
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def range(self, root, lo, hi):
+        """Yield keys k with lo <= k <= hi in sorted order, skipping subtrees outside the range."""
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                if node.key < lo:
+                    node = node.right  # the whole left subtree is below lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
+
+    def delete(self, root, key):
+        """Delete key from the AVL tree and return the new root."""
+        path = []
+        node = root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if not node:
+            return root  # Key not present
+
+        # A node with two children takes its in-order successor's key,
+        # and the successor (which has no left child) is removed instead
+        if node.left and node.right:
+            path.append(node)
+            succ = node.right
+            while succ.left:
+                path.append(succ)
+                succ = succ.left
+            node.key = succ.key
+            node = succ
+
+        child = node.left if node.left else node.right
+        if not path:
+            return child
+        for above in path:
+            above.size -= 1
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+        # Walk back up; unlike insert, a rotation can shorten the subtree
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            old_height = node.height
+            subtree = self.rebalance(node)
+            if subtree is not node:
+                if idx == 0:
+                    return subtree
+                above = path[idx - 1]
+                if above.left is node:
+                    above.left = subtree
+                else:
+                    above.right = subtree
+            if subtree.height == old_height:
+                break  # Nothing above can change
+        return root
+
+    def search(self, root, key):
+        """Return the node holding key, or None."""
+        node = root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def contains(self, root, key):
+        return self.search(root, key) is not None
+
+    def deleteMany(self, root, keys):
+        """Delete every key in keys, rebalancing each affected subtree once."""
+        keys = sorted(set(keys))
+        return self._deleteMany(root, keys, 0, len(keys))
+
+    def _deleteMany(self, node, keys, lo, hi):
+        if not node or lo == hi:
+            return node  # Untouched subtree
+        i = bisect_left(keys, node.key, lo, hi)
+        found = i < hi and keys[i] == node.key
+        left = self._deleteMany(node.left, keys, lo, i)
+        right = self._deleteMany(node.right, keys, i + 1 if found else i, hi)
+        if found:
+            return self._join2(left, right)
+        return self._join(left, node, right)
+
+    def deleteRange(self, root, lo, hi):
+        """Delete every key k with lo <= k <= hi."""
+        if not root:
+            return None
+        if root.key < lo:
+            return self._join(root.left, root, self.deleteRange(root.right, lo, hi))
+        if root.key > hi:
+            return self._join(self.deleteRange(root.left, lo, hi), root, root.right)
+        return self._join2(self.deleteRange(root.left, lo, hi), self.deleteRange(root.right, lo, hi))
+
+    # Split / join: O(log n) building blocks for merging and partitioning trees.
+    # They reuse the nodes of their inputs, so the input roots must not be used
+    # afterwards (PersistentAVLTree leaves them intact).
+    def join(self, left, key, right):
+        """Return the tree holding left's keys, key and right's keys (all of left < key < all of right)."""
+        return self._join(left, Node(key), right)
+
+    def split(self, root, key):
+        """Split into (keys < key, key present?, keys > key)."""
+        if not root:
+            return None, False, None
+        if key < root.key:
+            left, found, right = self.split(root.left, key)
+            return left, found, self._join(right, root, root.right)
+        if key > root.key:
+            left, found, right = self.split(root.right, key)
+            return self._join(root.left, root, left), found, right
+        return root.left, True, root.right
+
+    def union(self, a, b):
+        if not a:
+            return b
+        if not b:
+            return a
+        left, _, right = self.split(b, a.key)
+        a_left, a_right = a.left, a.right
+        return self._join(self.union(a_left, left), a, self.union(a_right, right))
+
+    def intersection(self, a, b):
+        if not a or not b:
+            return None
+        left, found, right = self.split(b, a.key)
+        a_left, a_right = a.left, a.right
+        left = self.intersection(a_left, left)
+        right = self.intersection(a_right, right)
+        if found:
+            return self._join(left, a, right)
+        return self._join2(left, right)
+
+    def difference(self, a, b):
+        """Keys of a that are not in b."""
+        if not a:
+            return None
+        if not b:
+            return a
+        left, _, right = self.split(a, b.key)
+        return self._join2(self.difference(left, b.left), self.difference(right, b.right))
+
+    # Join helpers: combine AVL trees whose keys are ordered left < node < right
+    def _join(self, left, node, right):
+        hl, hr = self.getHeight(left), self.getHeight(right)
+        if hl > hr + 1:
+            left.right = self._join(left.right, node, right)
+            return self.rebalance(left)
+        if hr > hl + 1:
+            right.left = self._join(left, node, right.left)
+            return self.rebalance(right)
+        node.left, node.right = left, right
+        node.height = 1 + max(hl, hr)
+        node.size = 1 + self.getSize(left) + self.getSize(right)
+        return node
+
+    def _join2(self, left, right):
+        if not left:
+            return right
+        if not right:
+            return left
+        right, first = self._popMin(right)
+        return self._join(left, first, right)
+
+    def _popMin(self, node):
+        if not node.left:
+            return node.right, node
+        node.left, first = self._popMin(node.left)
+        return self.rebalance(node), first
+
+    # Rotation helpers
+    def leftRotate(self, z):
+        y = z.right
+        T2 = y.left
+        y.left = z
+        z.right = T2
+        z.height = 1 + max(self.getHeight(z.left), self.getHeight(z.right))
+        y.height = 1 + max(self.getHeight(y.left), self.getHeight(y.right))
+        y.size = z.size
+        z.size = 1 + self.getSize(z.left) + self.getSize(z.right)
+        return y
+
+    def rightRotate(self, z):
+        y = z.left
+        T3 = y.right
+        y.right = z
+        z.left = T3
+        z.height = 1 + max(self.getHeight(z.left), self.getHeight(z.right))
+        y.height = 1 + max(self.getHeight(y.left), self.getHeight(y.right))
+        y.size = z.size
+        z.size = 1 + self.getSize(z.left) + self.getSize(z.right)
+        return y
+
+    def getHeight(self, node):
+        return 0 if not node else node.height
+
+    def getBalance(self, node):
+        return 0 if not node else self.getHeight(node.left) - self.getHeight(node.right)
+
+    def getSize(self, node):
+        return 0 if not node else node.size
+
+    # Binary snapshots (format described above MappedAVL)
+    def save(self, root, path):
+        """Write the tree's integer keys to a snapshot file."""
+        keys = array("q", self.inorder(root))
+        if sys.byteorder == "big":
+            keys.byteswap()
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(keys)))
+            f.write(keys.tobytes())
+
+    def load(self, path):
+        """Rebuild a tree from a snapshot file in linear time."""
+        with open(path, "rb") as f:
+            data = f.read()
+        _readHeader(data, path)
+        keys = array("q")
+        keys.frombytes(data[SNAPSHOT_HEADER.size:])
+        if sys.byteorder == "big":
+            keys.byteswap()
+        return self.buildSorted(keys)
+
+    def bytesPerKey(self, root):
+        """Average memory per key held by the Node objects (and their keys) of this tree."""
+        total = 0
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            total += sys.getsizeof(node) + sys.getsizeof(node.key)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return total / root.size if root else 0.0
+
+    # Order statistics
+    def rank(self, root, key):
+        """Number of keys strictly smaller than key."""
+        return self._countBelow(root, key, False)
+
+    def select(self, root, k):
+        """Return the k-th smallest key (0-based)."""
+        if not 0 <= k < self.getSize(root):
+            raise IndexError("select index out of range")
+        node = root
+        while True:
+            left_size = self.getSize(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.key
+
+    def countRange(self, root, lo, hi):
+        """Number of keys k with lo <= k <= hi."""
+        if hi < lo:
+            return 0
+        return self._countBelow(root, hi, True) - self._countBelow(root, lo, False)
+
+    def _countBelow(self, root, key, inclusive):
+        count = 0
+        node = root
+        while node:
+            if node.key < key or (inclusive and node.key == key):
+                count += 1 + self.getSize(node.left)
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+# ---------------- PERSISTENT (SNAPSHOT) TREE ----------------
+class PersistentAVLTree(AVLTree):
+    """AVL tree whose updates never modify an existing node.
+
+    insert and delete copy the O(log n) nodes on the search path (plus any
+    node a rotation touches) and return a new root that shares every other
+    subtree with the old one. Holding on to a root is therefore an O(1)
+    snapshot that later writes cannot change.
+    """
+
+    def __init__(self):
+        self.copies = 0  # nodes allocated by path copying
+
+    def copy(self, node):
+        new = Node(node.key)
+        new.left = node.left
+        new.right = node.right
+        new.height = node.height
+        new.size = node.size
+        self.copies += 1
+        return new
+
+    def insert(self, root, key):
+        path = []
+        node = root
+        while node:
+            if key == node.key:
+                return root  # Duplicate keys not allowed
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        subtree = Node(key)
+        return self._copyPath(path, key, subtree)
+
+    def delete(self, root, key):
+        path = []
+        node = root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if not node:
+            return root  # Key not present
+
+        if node.left and node.right:
+            rest, succ = self._popMin(node.right)
+            subtree = Node(succ.key)
+            subtree.left = node.left
+            subtree.right = rest
+            subtree = self.rebalance(subtree)
+        else:
+            subtree = node.left if node.left else node.right
+
+        return self._copyPath(path, key, subtree)
+
+    def _copyPath(self, path, key, subtree):
+        # Rebuild the search path bottom-up on top of the new subtree
+        for node in reversed(path):
+            node = self.copy(node)
+            if key < node.key:
+                node.left = subtree
+            else:
+                node.right = subtree
+            left, right = node.left, node.right
+            left_h = left.height if left else 0
+            right_h = right.height if right else 0
+            if left_h - right_h > 1 or right_h - left_h > 1:
+                subtree = self.rebalance(node)
+            else:
+                node.height = 1 + (left_h if left_h > right_h else right_h)
+                node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+                subtree = node
+        return subtree
+
+    # Rotations and join helpers copy the nodes they would otherwise modify
+    def leftRotate(self, z):
+        return AVLTree.leftRotate(self, self._withCopiedChild(z, "right"))
+
+    def rightRotate(self, z):
+        return AVLTree.rightRotate(self, self._withCopiedChild(z, "left"))
+
+    def _withCopiedChild(self, z, side):
+        z = self.copy(z)
+        setattr(z, side, self.copy(getattr(z, side)))
+        return z
+
+    def _join(self, left, node, right):
+        hl, hr = self.getHeight(left), self.getHeight(right)
+        if hl > hr + 1:
+            left = self.copy(left)
+            left.right = self._join(left.right, node, right)
+            return self.rebalance(left)
+        if hr > hl + 1:
+            right = self.copy(right)
+            right.left = self._join(left, node, right.left)
+            return self.rebalance(right)
+        return AVLTree._join(self, left, self.copy(node), right)
+
+    def _popMin(self, node):
+        if not node.left:
+            return node.right, node
+        node = self.copy(node)
+        node.left, first = self._popMin(node.left)
+        return self.rebalance(node), first
+
+# ---------------- CONCURRENT INDEX ----------------
+class ConcurrentAVLTree:
+    """Thread-safe AVL index with lock-free readers.
+
+    Writers serialise on a lock, build the next version with a
+    PersistentAVLTree and publish it with a single reference assignment.
+    Readers take the current root without locking and work on that
+    immutable snapshot, so they never block and never see a torn tree.
+    """
+
+    def __init__(self, keys=()):
+        self.tree = PersistentAVLTree()
+        self.lock = threading.Lock()
+        self.root = self.tree.fromKeys(keys)
+
+    # Writers
+    def insert(self, key):
+        with self.lock:
+            self.root = self.tree.insert(self.root, key)
+
+    def delete(self, key):
+        with self.lock:
+            self.root = self.tree.delete(self.root, key)
+
+    def writeBatch(self, inserts=(), deletes=()):
+        """Apply many updates under one lock acquisition and publish them together."""
+        with self.lock:
+            root = self.tree.insertMany(self.root, inserts)
+            if deletes:
+                root = self.tree.deleteMany(root, deletes)
+            self.root = root
+
+    # Readers
+    def snapshot(self):
+        return self.root
+
+    def search(self, key):
+        node = self.tree.search(self.root, key)
+        return node.key if node else None
+
+    def contains(self, key):
+        return self.tree.contains(self.root, key)
+
+    def inorder(self):
+        return self.tree.inorder(self.root)
+
+    def range(self, lo, hi):
+        return self.tree.range(self.root, lo, hi)
+
+    def rank(self, key):
+        return self.tree.rank(self.root, key)
+
+    def __len__(self):
+        return self.tree.getSize(self.root)
+
+# ---------------- COMPACT ARRAY STORAGE ----------------
+class ArrayAVLTree:
+    """AVL tree kept in parallel typed arrays instead of Node objects.
+
+    A node is an integer index and index 0 is the empty tree (height 0), so the
+    methods mirror AVLTree with root indices in place of Node references.
+    Freed slots are chained through the left array and reused by later inserts.
+    """
+
+    def __init__(self, typecode="q"):
+        self.keys = array(typecode, [0])
+        self.left = array("i", [0])
+        self.right = array("i", [0])
+        self.height = array("b", [0])
+        self.free = 0  # head of the free list
+        self.count = 0
+
+    def newNode(self, key):
+        idx = self.free
+        if idx:
+            self.free = self.left[idx]
+            self.keys[idx] = key
+            self.left[idx] = self.right[idx] = 0
+            self.height[idx] = 1
+        else:
+            idx = len(self.keys)
+            self.keys.append(key)
+            self.left.append(0)
+            self.right.append(0)
+            self.height.append(1)
+        self.count += 1
+        return idx
+
+    def freeNode(self, idx):
+        self.left[idx] = self.free
+        self.free = idx
+        self.count -= 1
+
+    def insert(self, root, key):
+        keys, left, right, height = self.keys, self.left, self.right, self.height
+        if not root:
+            return self.newNode(key)
+
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            if key < keys[node]:
+                node = left[node]
+            elif key > keys[node]:
+                node = right[node]
+            else:
+                return root  # Duplicate keys not allowed
+
+        parent = path[-1]
+        if key < keys[parent]:
+            left[parent] = self.newNode(key)
+        else:
+            right[parent] = self.newNode(key)
+
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            left_h = height[left[node]]
+            right_h = height[right[node]]
+            if left_h - right_h > 1 or right_h - left_h > 1:
+                subtree = self.rebalance(node)
+                if idx == 0:
+                    return subtree
+                self._replaceChild(path[idx - 1], node, subtree)
+                break
+            h = 1 + (left_h if left_h > right_h else right_h)
+            if h == height[node]:
+                break
+            height[node] = h
+        return root
+
+    def delete(self, root, key):
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        node = root
+        while node and keys[node] != key:
+            path.append(node)
+            node = left[node] if key < keys[node] else right[node]
+        if not node:
+            return root  # Key not present
+
+        if left[node] and right[node]:
+            path.append(node)
+            succ = right[node]
+            while left[succ]:
+                path.append(succ)
+                succ = left[succ]
+            keys[node] = keys[succ]
+            node = succ
+
+        child = left[node] if left[node] else right[node]
+        self.freeNode(node)
+        if not path:
+            return child
+        self._replaceChild(path[-1], node, child)
+
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            old_height = self.height[node]
+            subtree = self.rebalance(node)
+            if subtree != node:
+                if idx == 0:
+                    return subtree
+                self._replaceChild(path[idx - 1], node, subtree)
+            if self.height[subtree] == old_height:
+                break
+        return root
+
+    def search(self, root, key):
+        """Return the index holding key, or 0."""
+        keys, left, right = self.keys, self.left, self.right
+        node = root
+        while node:
+            k = keys[node]
+            if key < k:
+                node = left[node]
+            elif key > k:
+                node = right[node]
+            else:
+                return node
+        return 0
+
+    def contains(self, root, key):
+        return self.search(root, key) != 0
+
+    def inorder(self, root):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def levelOrder(self, root):
+        keys, left, right = self.keys, self.left, self.right
+        queue = deque([root] if root else [])
+        while queue:
+            node = queue.popleft()
+            yield keys[node]
+            if left[node]:
+                queue.append(left[node])
+            if right[node]:
+                queue.append(right[node])
+
+    def range(self, root, lo, hi):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                if keys[node] < lo:
+                    node = right[node]
+                else:
+                    stack.append(node)
+                    node = left[node]
+            if not stack:
+                return
+            node = stack.pop()
+            if keys[node] > hi:
+                return
+            yield keys[node]
+            node = right[node]
+
+    def bytesPerKey(self):
+        """Average bytes of array storage per live key (free slots included)."""
+        if not self.count:
+            return 0.0
+        total = sum(a.itemsize * len(a) for a in (self.keys, self.left, self.right, self.height))
+        return total / self.count
+
+    # Balancing helpers
+    def rebalance(self, node):
+        left, right, height = self.left, self.right, self.height
+        self._updateHeight(node)
+        balance = height[left[node]] - height[right[node]]
+        if balance > 1:
+            child = left[node]
+            if height[left[child]] < height[right[child]]:
+                left[node] = self.leftRotate(child)
+            return self.rightRotate(node)
+        if balance < -1:
+            child = right[node]
+            if height[right[child]] < height[left[child]]:
+                right[node] = self.rightRotate(child)
+            return self.leftRotate(node)
+        return node
+
+    def leftRotate(self, z):
+        left, right = self.left, self.right
+        y = right[z]
+        right[z] = left[y]
+        left[y] = z
+        self._updateHeight(z)
+        self._updateHeight(y)
+        return y
+
+    def rightRotate(self, z):
+        left, right = self.left, self.right
+        y = left[z]
+        left[z] = right[y]
+        right[y] = z
+        self._updateHeight(z)
+        self._updateHeight(y)
+        return y
+
+    def _updateHeight(self, node):
+        height = self.height
+        left_h = height[self.left[node]]
+        right_h = height[self.right[node]]
+        height[node] = 1 + (left_h if left_h > right_h else right_h)
+
+    def _replaceChild(self, parent, old, new):
+        if self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+# ---------------- BINARY SNAPSHOTS ----------------
+# Layout: a 16-byte header (magic, version, key count) followed by the keys as
+# little-endian int64 in sorted order. That array is the implicit form of the
+# tree buildSorted produces (node = middle of its range), so heights need not
+# be stored: a range of c keys always has height c.bit_length().
+SNAPSHOT_MAGIC = b"AVLS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sB3xQ")
+
+
+def _readHeader(buf, path):
+    if len(buf) < SNAPSHOT_HEADER.size:
+        raise ValueError(f"{path}: not an AVL snapshot")
+    magic, version, count = SNAPSHOT_HEADER.unpack_from(buf)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"{path}: not an AVL snapshot (or unsupported version)")
+    if len(buf) != SNAPSHOT_HEADER.size + 8 * count:
+        raise ValueError(f"{path}: AVL snapshot size does not match its key count")
+    return count
+
+
+class MappedAVL:
+    """Read-only AVL snapshot queried straight from a memory-mapped file.
+
+    Lookups descend the implicit tree (binary search over the mapped keys), so
+    no Node objects are created unless toTree is called.
+    """
+
+    def __init__(self, path):
+        if sys.byteorder == "big":
+            raise ValueError("MappedAVL needs a little-endian host; use AVLTree.load instead")
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _readHeader(self.map, path)
+        self.keys = memoryview(self.map)[SNAPSHOT_HEADER.size:].cast("q")
+
+    def close(self):
+        self.keys.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def contains(self, key):
+        i = bisect_left(self.keys, key)
+        return i < len(self.keys) and self.keys[i] == key
+
+    def rank(self, key):
+        return bisect_left(self.keys, key)
+
+    def select(self, k):
+        if not 0 <= k < len(self.keys):
+            raise IndexError("select index out of range")
+        return self.keys[k]
+
+    def countRange(self, lo, hi):
+        if hi < lo:
+            return 0
+        return bisect_right(self.keys, hi) - bisect_left(self.keys, lo)
+
+    def inorder(self):
+        return iter(self.keys)
+
+    def range(self, lo, hi):
+        keys = self.keys
+        for i in range(bisect_left(keys, lo), bisect_right(keys, hi)):
+            yield keys[i]
+
+    def toTree(self, tree):
+        """Materialise the snapshot as Node objects for the given AVLTree."""
+        return tree.buildSorted(self.keys)
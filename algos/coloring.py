@@ -0,0 +1,799 @@
+"""Graph coloring without any GUI dependency.
+
+CSR graphs, greedy/DSATUR heuristics, exact and parallel backtracking search,
+incremental recoloring and a force-directed layout. graph_colouring.py
+visualizes them.
+"""
+from array import array
+import heapq
+import random
+import re
+import time
+import math
+
+__all__ = [
+    "CSRGraph", "as_graph", "force_directed_layout",
+    "backtracking_coloring", "greedy_coloring", "largest_degree_order", "smallest_last_order",
+    "welsh_powell_coloring", "smallest_last_coloring", "dsatur_coloring", "greedy_clique",
+    "adjacency_bitsets", "exact_coloring", "parallel_backtracking_coloring", "DynamicColoring",
+]
+
+DENSE_LAYOUT_LIMIT = 1500  # the dense NumPy layout needs n * n * 16 bytes per iteration
+GRID_SAMPLE = 32  # at most this many vertices repel each grid cell per iteration
+
+# "u v", "u,v" or "u-v"; a '-' directly before digits is a sign, so "3 -1" stays negative
+_EDGE_LINE = re.compile(r"(-?\d+)(?:\s*,\s*|\s+|-|\s*-\s*)(-?\d+)")
+
+_np = False  # NumPy is optional (.npy loaders, vectorized layout) and slow to import
+
+
+def _numpy():
+    """Return NumPy, importing it on first use, or None if it is not installed."""
+    global _np
+    if _np is False:
+        try:
+            import numpy as _np
+        except ImportError:
+            _np = None
+    return _np
+
+
+#--------------------------------------------------------------
+# Graph representation
+class CSRGraph:
+    """Undirected graph in compressed-sparse-row form.
+
+    The neighbours of v are neighbors[offsets[v]:offsets[v + 1]]; both are flat
+    int64 arrays, so there are no per-vertex Python lists. Every edge is
+    stored in both directions.
+    """
+
+    __slots__ = ("n", "offsets", "neighbors")
+
+    def __init__(self, n, offsets, neighbors):
+        if len(offsets) != n + 1 or offsets[n] != len(neighbors):
+            raise ValueError("offsets do not match the neighbor array")
+        self.n = n
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @property
+    def num_edges(self):
+        return len(self.neighbors) // 2
+
+    def degree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def neighbors_of(self, v):
+        return self.neighbors[self.offsets[v]:self.offsets[v + 1]]
+
+    def edges(self):
+        """Yield every edge once as (u, v) with u < v."""
+        offsets, neighbors = self.offsets, self.neighbors
+        for u in range(self.n):
+            for i in range(offsets[u], offsets[u + 1]):
+                if u < neighbors[i]:
+                    yield u, neighbors[i]
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """Build from an edge sequence that can be iterated twice (e.g. a list of pairs)."""
+        return cls._build(n, lambda: iter(edges))
+
+    @classmethod
+    def from_edge_list_file(cls, path, n=None):
+        """Stream an edge list file ("u v", "u,v" or "u-v" per line, '#' comments).
+
+        The file is read twice - once to count degrees, once to fill the
+        neighbor array - so only the two CSR arrays are ever held in memory.
+        If n is not given it is one more than the largest vertex id, found
+        during the degree pass.
+        """
+        def read_edges():
+            with open(path) as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.split("#", 1)[0].strip()
+                    if not line:
+                        continue
+                    match = _EDGE_LINE.fullmatch(line)
+                    if not match:
+                        raise ValueError(f"{path}:{line_no}: expected two vertex ids")
+                    yield int(match.group(1)), int(match.group(2))
+
+        return cls._build(n, read_edges)
+
+    @classmethod
+    def from_npy(cls, offsets_path, neighbors_path):
+        """Load the binary pair written by save_npy (needs NumPy)."""
+        np = _numpy()
+        if np is None:
+            raise ImportError("loading .npy graphs requires NumPy")
+        offsets = array("q")
+        offsets.frombytes(np.load(offsets_path, mmap_mode="r").astype("<i8").tobytes())
+        neighbors = array("q")
+        neighbors.frombytes(np.load(neighbors_path, mmap_mode="r").astype("<i8").tobytes())
+        return cls(len(offsets) - 1, offsets, neighbors)
+
+    def save_npy(self, offsets_path, neighbors_path):
+        np = _numpy()
+        if np is None:
+            raise ImportError("saving .npy graphs requires NumPy")
+        np.save(offsets_path, np.frombuffer(self.offsets, dtype=np.int64))
+        np.save(neighbors_path, np.frombuffer(self.neighbors, dtype=np.int64))
+
+    @classmethod
+    def _build(cls, n, edge_source):
+        # Pass 1: degrees. Self-loops are dropped; they can never be coloured.
+        # With n=None the vertex count grows to cover the largest id seen.
+        offsets = array("q", bytes(8 * ((n or 0) + 1)))
+        for u, v in edge_source():
+            if n is None and u >= 0 and v >= 0 and max(u, v) + 2 > len(offsets):
+                offsets.frombytes(bytes(8 * (max(u, v) + 2 - len(offsets))))
+            if not (0 <= u < len(offsets) - 1 and 0 <= v < len(offsets) - 1):
+                raise ValueError(f"edge {u}-{v} is out of range for {len(offsets) - 1} vertices")
+            if u != v:
+                offsets[u + 1] += 1
+                offsets[v + 1] += 1
+        n = len(offsets) - 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+
+        # Pass 2: fill neighbor slots
+        neighbors = array("q", bytes(8 * offsets[n]))
+        cursor = offsets[:-1]
+        for u, v in edge_source():
+            if u != v:
+                neighbors[cursor[u]] = v
+                cursor[u] += 1
+                neighbors[cursor[v]] = u
+                cursor[v] += 1
+        return cls(n, offsets, neighbors)
+
+
+def as_graph(n, edges):
+    """Accept either a CSRGraph or an (n, list of (u, v) pairs) description."""
+    if isinstance(edges, CSRGraph):
+        return edges
+    return CSRGraph.from_edges(n, edges)
+
+#--------------------------------------------------------------
+# Force-directed layout (Fruchterman-Reingold)
+def force_directed_layout(graph, width, height, iterations=None, margin=30, seed=0, progress=None,
+                          cancel=None):
+    """Return a list of (x, y) canvas positions for every vertex.
+
+    With NumPy and up to DENSE_LAYOUT_LIMIT vertices all pairwise repulsions
+    are computed as array operations; otherwise only vertices in neighbouring
+    grid cells repel each other, which keeps each iteration near O(n + m).
+    progress(done, total) is called once per iteration; setting the optional
+    threading.Event cancel stops iterating early.
+    """
+    n = graph.n
+    if iterations is None:
+        iterations = 60 if n <= 5000 else 20
+    if n == 0:
+        return []
+    if n == 1:
+        return [(width / 2, height / 2)]
+
+    # Small graphs start from the old circle layout, slightly jittered so symmetric graphs
+    # can unfold; large ones start spread over the box so grid cells stay sparse
+    rnd = random.Random(seed)
+    if n <= 200:
+        pos = [[math.cos(2 * math.pi * i / n) + rnd.uniform(-0.05, 0.05),
+                math.sin(2 * math.pi * i / n) + rnd.uniform(-0.05, 0.05)] for i in range(n)]
+    else:
+        pos = [[rnd.uniform(-1, 1), rnd.uniform(-1, 1)] for _ in range(n)]
+
+    np = _numpy() if n <= DENSE_LAYOUT_LIMIT else None
+    if np is not None:
+        pos = _layout_dense(graph, np.array(pos), iterations, progress, cancel).tolist()
+    else:
+        _layout_grid(graph, pos, iterations, progress, cancel, rnd)
+
+    # Scale into the canvas, keeping the aspect ratio
+    xs = [p[0] for p in pos]
+    ys = [p[1] for p in pos]
+    span_x = (max(xs) - min(xs)) or 1.0
+    span_y = (max(ys) - min(ys)) or 1.0
+    scale = min((width - 2 * margin) / span_x, (height - 2 * margin) / span_y)
+    off_x = (width - scale * span_x) / 2 - scale * min(xs)
+    off_y = (height - scale * span_y) / 2 - scale * min(ys)
+    return [(off_x + scale * x, off_y + scale * y) for x, y in pos]
+
+
+def _layout_dense(graph, pos, iterations, progress, cancel):
+    np = _numpy()
+    n = graph.n
+    k = math.sqrt(4.0 / n)  # ideal edge length in a 2 x 2 box
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    dst = np.frombuffer(graph.neighbors, dtype=np.int64)
+    src = np.repeat(np.arange(n), np.diff(offsets))
+    temperature = min(0.2, 10 * k)  # largest step per iteration
+    for it in range(iterations):
+        if cancel is not None and cancel.is_set():
+            break
+        delta = pos[:, None, :] - pos[None, :, :]
+        dist2 = (delta ** 2).sum(axis=2) + 1e-9
+        disp = (delta * (k * k / dist2)[:, :, None]).sum(axis=1)
+        # Each undirected edge appears in both directions, so every endpoint is pulled once
+        d = pos[src] - pos[dst]
+        length = np.sqrt((d ** 2).sum(axis=1)) + 1e-9
+        np.add.at(disp, src, -d * (length / k)[:, None])
+        norm = np.sqrt((disp ** 2).sum(axis=1)) + 1e-9
+        pos += disp * (np.minimum(norm, temperature) / norm)[:, None]
+        np.clip(pos, -1.0, 1.0, out=pos)
+        temperature *= 0.95
+        if progress:
+            progress(it + 1, iterations)
+    return pos
+
+
+def _layout_grid(graph, pos, iterations, progress, cancel, rnd):
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    k = math.sqrt(4.0 / n)
+    cell = 2 * k  # repulsion beyond this distance is ignored
+    temperature = min(0.2, 10 * k)
+    for it in range(iterations):
+        if cancel is not None and cancel.is_set():
+            break
+        grid = {}
+        for v, (x, y) in enumerate(pos):
+            grid.setdefault((int(x // cell), int(y // cell)), []).append(v)
+        disp = [[0.0, 0.0] for _ in range(n)]
+        for (cx, cy), members in grid.items():
+            nearby = [w for gx in (cx - 1, cx, cx + 1) for gy in (cy - 1, cy, cy + 1)
+                      for w in grid.get((gx, gy), ())]
+            # Crowded neighbourhoods are sampled and the forces scaled up to match
+            weight = 1.0
+            if len(nearby) > GRID_SAMPLE:
+                weight = len(nearby) / GRID_SAMPLE
+                nearby = rnd.sample(nearby, GRID_SAMPLE)
+            for v in members:
+                x, y = pos[v]
+                dv = disp[v]
+                for w in nearby:
+                    if w != v:
+                        dx = x - pos[w][0]
+                        dy = y - pos[w][1]
+                        d2 = dx * dx + dy * dy + 1e-9
+                        if d2 < cell * cell:
+                            f = weight * k * k / d2
+                            dv[0] += dx * f
+                            dv[1] += dy * f
+        for v in range(n):
+            x, y = pos[v]
+            dv = disp[v]
+            for i in range(offsets[v], offsets[v + 1]):
+                w = neighbors[i]
+                dx = x - pos[w][0]
+                dy = y - pos[w][1]
+                length = math.sqrt(dx * dx + dy * dy) + 1e-9
+                dv[0] -= dx * length / k
+                dv[1] -= dy * length / k
+        for v in range(n):
+            dx, dy = disp[v]
+            norm = math.sqrt(dx * dx + dy * dy) + 1e-9
+            step = min(norm, temperature) / norm
+            # Clamp to the frame: without long-range repulsion the layout would otherwise collapse
+            pos[v][0] = min(1.0, max(-1.0, pos[v][0] + dx * step))
+            pos[v][1] = min(1.0, max(-1.0, pos[v][1] + dy * step))
+        temperature *= 0.95
+        if progress:
+            progress(it + 1, iterations)
+
+#--------------------------------------------------------------
+# Coloring algorithms on a CSRGraph; all return (coloring, steps)
+def backtracking_coloring(graph, max_colors, cancel=None):
+    """Plain backtracking in vertex order; returns (coloring, steps).
+
+    cancel is an optional threading.Event; once it is set the search stops and
+    returns the partial coloring it had reached, with -1 for the vertices
+    after it. The search recurses once per
+    vertex, so graphs above the recursion limit (about 1,000 vertices) raise
+    RecursionError; use the greedy strategies or exact_coloring for those.
+    """
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    result = [-1] * n
+    steps = 0
+
+    def is_safe(v, c):
+        for i in range(offsets[v], offsets[v + 1]):
+            if result[neighbors[i]] == c:
+                return False
+        return True
+
+    def solve(v):
+        nonlocal steps
+        if v == n:
+            return True
+        if cancel is not None and cancel.is_set():
+            return False
+        steps += 1
+        for c in range(max_colors):
+            if is_safe(v, c):
+                result[v] = c
+                if solve(v + 1):
+                    return True
+                if cancel is not None and cancel.is_set():
+                    return False  # unwind without erasing the partial coloring
+                result[v] = -1
+        return False
+
+    solve(0)
+    return result, steps
+
+
+def greedy_coloring(graph, max_colors, order=None):
+    """Give each vertex, in order (default 0..n-1), the smallest color no neighbour has."""
+    offsets, neighbors = graph.offsets, graph.neighbors
+    result = [-1] * graph.n
+    steps = 0
+    for u in (range(graph.n) if order is None else order):
+        steps += 1
+        # Bitmask of colors already taken by neighbours
+        forbidden = 0
+        for i in range(offsets[u], offsets[u + 1]):
+            c = result[neighbors[i]]
+            if c != -1:
+                forbidden |= 1 << c
+        color = (~forbidden & (forbidden + 1)).bit_length() - 1  # lowest free color
+        result[u] = color if color < max_colors else -1
+    return result, steps
+
+
+def largest_degree_order(graph):
+    """Welsh-Powell order: vertices by decreasing degree."""
+    offsets = graph.offsets
+    return sorted(range(graph.n), key=lambda v: offsets[v] - offsets[v + 1])
+
+
+def smallest_last_order(graph):
+    """Repeatedly remove a vertex of minimum remaining degree; color in reverse removal order."""
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    degree = [offsets[v + 1] - offsets[v] for v in range(n)]
+    buckets = [set() for _ in range(max(degree, default=0) + 1)]
+    for v in range(n):
+        buckets[degree[v]].add(v)
+
+    removed = [False] * n
+    order = []
+    low = 0
+    for _ in range(n):
+        while not buckets[low]:
+            low += 1
+        v = buckets[low].pop()
+        removed[v] = True
+        order.append(v)
+        for i in range(offsets[v], offsets[v + 1]):
+            w = neighbors[i]
+            if not removed[w]:
+                buckets[degree[w]].discard(w)
+                degree[w] -= 1
+                buckets[degree[w]].add(w)
+                if degree[w] < low:
+                    low = degree[w]
+    order.reverse()
+    return order
+
+
+def welsh_powell_coloring(graph, max_colors):
+    return greedy_coloring(graph, max_colors, largest_degree_order(graph))
+
+
+def smallest_last_coloring(graph, max_colors):
+    return greedy_coloring(graph, max_colors, smallest_last_order(graph))
+
+
+def dsatur_coloring(graph, max_colors):
+    """DSATUR: always color the vertex with the most distinct neighbour colors (ties: highest degree)."""
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    result = [-1] * n
+    done = [False] * n
+    seen = [0] * n  # bitmask of neighbour colors, i.e. the forbidden set
+    steps = 0
+
+    # Max-heap via negated keys; stale entries are skipped when popped
+    heap = [(0, offsets[v] - offsets[v + 1], v) for v in range(n)]
+    heapq.heapify(heap)
+    while heap:
+        neg_sat, _, u = heapq.heappop(heap)
+        if done[u] or -neg_sat != seen[u].bit_count():
+            continue
+        steps += 1
+        done[u] = True
+        forbidden = seen[u]
+        color = (~forbidden & (forbidden + 1)).bit_length() - 1
+        if color >= max_colors:
+            continue  # left uncolored (-1)
+        result[u] = color
+        bit = 1 << color
+        for i in range(offsets[u], offsets[u + 1]):
+            w = neighbors[i]
+            if not done[w] and not seen[w] & bit:
+                seen[w] |= bit
+                heapq.heappush(heap, (-seen[w].bit_count(), offsets[w] - offsets[w + 1], w))
+    return result, steps
+
+
+def greedy_clique(graph, adjacency=None, starts=64):
+    """A large clique found greedily from the highest-degree vertices (a lower bound on colors)."""
+    adjacency = adjacency or adjacency_bitsets(graph)
+    order = largest_degree_order(graph)[:starts]
+    best = []
+    for v in order:
+        clique = [v]
+        candidates = adjacency[v]
+        while candidates:
+            # Extend with the candidate that keeps the most other candidates
+            pick, pick_score = -1, -1
+            rest = candidates
+            while rest:
+                low = rest & -rest
+                u = low.bit_length() - 1
+                rest ^= low
+                score = (adjacency[u] & candidates).bit_count()
+                if score > pick_score:
+                    pick, pick_score = u, score
+            clique.append(pick)
+            candidates &= adjacency[pick]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def adjacency_bitsets(graph):
+    offsets, neighbors = graph.offsets, graph.neighbors
+    adjacency = []
+    for v in range(graph.n):
+        bits = 0
+        for i in range(offsets[v], offsets[v + 1]):
+            bits |= 1 << neighbors[i]
+        adjacency.append(bits)
+    return adjacency
+
+
+def exact_coloring(graph, cancel=None):
+    """Minimum coloring by DSATUR branch and bound; returns (coloring, nodes explored).
+
+    The DSATUR coloring is the initial upper bound and a greedy clique the
+    lower bound (its vertices are precolored 0..q-1). Each branch colors the
+    most saturated vertex, tries at most one color that is new to the partial
+    solution (colors are interchangeable), and forward-checks the uncolored
+    neighbours' bitmask domains, backtracking as soon as one is empty.
+    If the optional threading.Event cancel is set, the best coloring found so
+    far is returned.
+    """
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    best, _ = dsatur_coloring(graph, max(n, 1))
+    best_k = max(best, default=-1) + 1
+    adjacency = adjacency_bitsets(graph)
+    clique = greedy_clique(graph, adjacency)
+    nodes = 0
+    if len(clique) >= best_k:
+        return best, nodes
+
+    degree = [offsets[v + 1] - offsets[v] for v in range(n)]
+    color = [-1] * n
+    forbid = [0] * n  # bitmask of colors used by colored neighbours
+    uncolored = set(range(n))
+
+    def assign(v, c):
+        # Color v with c; return the neighbours whose domain shrank and whether one became empty
+        color[v] = c
+        uncolored.discard(v)
+        bit = 1 << c
+        full = (1 << (best_k - 1)) - 1  # colors allowed when looking for a better solution
+        changed = []
+        wiped = False
+        for i in range(offsets[v], offsets[v + 1]):
+            w = neighbors[i]
+            if color[w] == -1 and not forbid[w] & bit:
+                forbid[w] |= bit
+                changed.append(w)
+                if forbid[w] & full == full:
+                    wiped = True
+        return changed, wiped
+
+    def unassign(v, changed):
+        bit = 1 << color[v]
+        for w in changed:
+            forbid[w] &= ~bit
+        color[v] = -1
+        uncolored.add(v)
+
+    # Depth-first search on an explicit stack: the depth is the number of uncolored
+    # vertices, too deep for recursion on large graphs. A frame is
+    # [vertex, next color to try, colors used so far, neighbours changed by the current color].
+    stack = []
+
+    def enter(used):
+        nonlocal nodes, best, best_k
+        nodes += 1
+        if not uncolored:
+            if used < best_k:
+                best, best_k = color[:], used
+            return
+        v = max(uncolored, key=lambda u: (forbid[u].bit_count(), degree[u]))
+        stack.append([v, 0, used, None])
+
+    for c, v in enumerate(clique):
+        assign(v, c)
+    enter(len(clique))
+    while stack:
+        if cancel is not None and cancel.is_set():
+            break
+        frame = stack[-1]
+        v, c, used, changed = frame
+        if changed is not None:
+            unassign(v, changed)
+            frame[3] = None
+            if best_k <= len(clique):
+                break  # matches the lower bound: optimal
+        # Re-checked each time: a sibling branch may have lowered best_k
+        limit = min(used + 1, best_k - 1)
+        while c < limit and forbid[v] >> c & 1:
+            c += 1
+        if c >= limit:
+            stack.pop()
+            continue
+        frame[1] = c + 1
+        frame[3], wiped = assign(v, c)
+        if not wiped:
+            enter(max(used, c + 1))
+    return best, nodes
+
+
+#--------------------------------------------------------------
+# Parallel, time-bounded backtracking
+_worker = {}
+
+
+def _init_backtracking_worker(graph, max_colors, cancel, deadline):
+    _worker.update(graph=graph, max_colors=max_colors, cancel=cancel, deadline=deadline)
+
+
+def _solve_prefix(prefix):
+    """Finish the backtracking search below one fixed prefix of vertex colors.
+
+    Returns (complete, coloring, steps); when the search is cancelled or runs
+    out of time, coloring is the deepest valid partial coloring reached.
+    """
+    graph, max_colors = _worker["graph"], _worker["max_colors"]
+    cancel, deadline = _worker["cancel"], _worker["deadline"]
+    n, offsets, neighbors = graph.n, graph.offsets, graph.neighbors
+    result = prefix + [-1] * (n - len(prefix))
+    best = result[:]
+    best_depth = len(prefix)
+    steps = 0
+    if cancel.is_set():
+        return False, result, steps  # another worker already finished
+
+    def is_safe(v, c):
+        for i in range(offsets[v], offsets[v + 1]):
+            if result[neighbors[i]] == c:
+                return False
+        return True
+
+    # Depth-first search without recursion (one level per vertex would overflow
+    # the stack on large graphs): result[v] doubles as the color v is trying
+    start = v = len(prefix)
+    entering = True
+    while v < n:
+        if entering:
+            steps += 1
+            if steps & 1023 == 0 and (cancel.is_set() or time.time() > deadline):
+                return False, best, steps
+            if v > best_depth:
+                best, best_depth = result[:], v
+            c = 0
+        else:
+            c = result[v] + 1
+            result[v] = -1
+        while c < max_colors and not is_safe(v, c):
+            c += 1
+        if c < max_colors:
+            result[v] = c
+            v += 1
+            entering = True
+        elif v == start:
+            return False, best, steps
+        else:
+            v -= 1
+            entering = False
+    return True, result, steps
+
+
+def _split_prefixes(graph, max_colors, target):
+    """Expand the first vertices breadth-first into at least target valid color prefixes."""
+    offsets, neighbors = graph.offsets, graph.neighbors
+    prefixes = [[]]
+    steps = 0
+    v = 0
+    while v < graph.n and len(prefixes) < target:
+        expanded = []
+        for prefix in prefixes:
+            steps += 1
+            taken = {prefix[neighbors[i]] for i in range(offsets[v], offsets[v + 1]) if neighbors[i] < v}
+            expanded.extend(prefix + [c] for c in range(max_colors) if c not in taken)
+        prefixes = expanded
+        v += 1
+    return prefixes, steps
+
+
+def parallel_backtracking_coloring(graph, max_colors, time_budget=10.0, workers=None, cancel=None):
+    """Backtracking split into subproblems on a process pool, stopped after time_budget seconds.
+
+    The first vertices' color choices are enumerated into independent
+    prefixes; the first worker to complete a coloring cancels the rest.
+    Returns (coloring, steps) where steps totals all workers; if no complete
+    coloring was found in time, the deepest partial coloring is returned
+    with -1 for the vertices it did not reach. Setting the optional
+    threading.Event cancel stops the workers the same way as the deadline.
+    """
+    # Imported here: the process-pool machinery costs more to import than the rest of the module
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    import multiprocessing
+
+    deadline = time.time() + time_budget
+    ctx = multiprocessing.get_context()
+    workers = workers or multiprocessing.cpu_count()
+
+    prefixes, steps = _split_prefixes(graph, max_colors, 4 * workers)
+    if not prefixes:
+        return [-1] * graph.n, steps
+    if len(prefixes[0]) == graph.n:
+        return prefixes[0], steps
+
+    stop = ctx.Event()  # shared with the workers
+    best, best_depth = [-1] * graph.n, -1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_backtracking_worker,
+                             initargs=(graph, max_colors, stop, deadline)) as pool:
+        pending = {pool.submit(_solve_prefix, prefix) for prefix in prefixes}
+        while pending:
+            # Short waits so the caller's cancel is passed on promptly
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                complete, coloring, worker_steps = future.result()
+                steps += worker_steps
+                if complete:
+                    stop.set()
+                    for other in pending:
+                        other.cancel()
+                    return coloring, steps
+                depth = sum(1 for c in coloring if c != -1)
+                if depth > best_depth:
+                    best, best_depth = coloring, depth
+            if time.time() > deadline or (cancel is not None and cancel.is_set()):
+                stop.set()  # workers notice within ~1000 steps and return their partial results
+    return best, steps
+
+
+#--------------------------------------------------------------
+# Incremental recoloring for dynamic graphs
+class DynamicColoring:
+    """A proper coloring of a graph that changes one vertex or edge at a time.
+
+    Each update only looks at the vertices it touches: a conflict created by
+    add_edge is repaired by giving one endpoint a free color, then by a
+    bounded Kempe-chain swap, and only then by opening a new color. Update
+    methods return the number of vertices whose color changed.
+    """
+
+    def __init__(self, n=0, edges=(), kempe_limit=256):
+        self.adj = {}
+        self.color = {}
+        self.color_count = {}  # color -> number of vertices using it
+        self.kempe_limit = kempe_limit
+        self.next_id = 0
+        for v in range(n):
+            self.add_vertex(v)
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    @property
+    def num_colors(self):
+        return len(self.color_count)
+
+    def add_vertex(self, v=None):
+        if v is None:
+            v = self.next_id
+        if v in self.adj:
+            return v
+        self.next_id = max(self.next_id, v + 1)
+        self.adj[v] = set()
+        self._set_color(v, min(self.color_count, default=0))
+        return v
+
+    def remove_vertex(self, v):
+        for w in self.adj.pop(v):
+            self.adj[w].discard(v)
+        self._drop_color(self.color.pop(v))
+        return 0
+
+    def add_edge(self, u, v):
+        if u == v:
+            raise ValueError("self-loops cannot be colored")
+        self.add_vertex(u)
+        self.add_vertex(v)
+        if v in self.adj[u]:
+            return 0
+        self.adj[u].add(v)
+        self.adj[v].add(u)
+        if self.color[u] != self.color[v]:
+            return 0
+
+        # Repair the endpoint with the smaller neighbourhood first
+        x, y = (u, v) if len(self.adj[u]) <= len(self.adj[v]) else (v, u)
+        for vertex in (x, y):
+            free = self._lowest_used_free(vertex)
+            if free is not None:
+                self._set_color(vertex, free)
+                return 1
+        for vertex, other in ((x, y), (y, x)):
+            recolored = self._kempe_repair(vertex, other)
+            if recolored:
+                return recolored
+        self._set_color(x, self._lowest_free(x))  # a new color is unavoidable locally
+        return 1
+
+    def remove_edge(self, u, v):
+        if v not in self.adj.get(u, ()):
+            return 0
+        self.adj[u].discard(v)
+        self.adj[v].discard(u)
+        # No conflict can appear; let the endpoints move down if that frees a color
+        recolored = 0
+        for x in (u, v):
+            free = self._lowest_used_free(x)
+            if free is not None and free < self.color[x]:
+                self._set_color(x, free)
+                recolored += 1
+        return recolored
+
+    def is_proper(self):
+        return all(self.color[u] != self.color[w] for u in self.adj for w in self.adj[u])
+
+    # Helpers
+    def _lowest_free(self, v):
+        forbidden = 0
+        for w in self.adj[v]:
+            forbidden |= 1 << self.color[w]
+        return (~forbidden & (forbidden + 1)).bit_length() - 1
+
+    def _lowest_used_free(self, v):
+        # Color ids can have gaps after removals, so look only at colors still in use
+        forbidden = {self.color[w] for w in self.adj[v]}
+        return min((c for c in self.color_count if c not in forbidden), default=None)
+
+    def _kempe_repair(self, x, y):
+        """Swap colors c/d on x's Kempe chain (ignoring edge x-y) so x stops clashing with y."""
+        c = self.color[x]
+        for d in sorted({self.color[w] for w in self.adj[x]} - {c}):
+            chain = {x}
+            stack = [x]
+            while stack and len(chain) <= self.kempe_limit:
+                a = stack.pop()
+                want = d if self.color[a] == c else c
+                for b in self.adj[a]:
+                    if b not in chain and self.color[b] == want and {a, b} != {x, y}:
+                        chain.add(b)
+                        stack.append(b)
+            if stack or y in chain:
+                continue  # chain too long, or swapping would move y as well
+            for a in chain:
+                self._set_color(a, d if self.color[a] == c else c)
+            return len(chain)
+        return 0
+
+    def _set_color(self, v, c):
+        old = self.color.get(v)
+        if old is not None:
+            self._drop_color(old)
+        self.color[v] = c
+        self.color_count[c] = self.color_count.get(c, 0) + 1
+
+    def _drop_color(self, c):
+        self.color_count[c] -= 1
+        if not self.color_count[c]:
+            del self.color_count[c]
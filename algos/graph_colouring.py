@@ -1,11 +1,33 @@
 import tkinter as tk
-from tkinter import messagebox
-from time import perf_counter
+from tkinter import filedialog, messagebox
 import math
+import queue
+import threading
+from time import perf_counter
+
+if __package__:
+    from .coloring import (
+        CSRGraph, as_graph, backtracking_coloring, dsatur_coloring, exact_coloring,
+        force_directed_layout, greedy_coloring, parallel_backtracking_coloring,
+        smallest_last_coloring, welsh_powell_coloring,
+    )
+else:  # run as a script, e.g. python algos/graph_colouring.py
+    from coloring import (
+        CSRGraph, as_graph, backtracking_coloring, dsatur_coloring, exact_coloring,
+        force_directed_layout, greedy_coloring, parallel_backtracking_coloring,
+        smallest_last_coloring, welsh_powell_coloring,
+    )
 
 class GraphColoringVisualizer:
+    TIME_BUDGET = 10.0      # seconds allowed for "Parallel Backtracking"
+    MAX_DRAWN_EDGES = 3000  # level of detail: larger graphs show an evenly sampled subset of edges
+    LABEL_LIMIT = 60        # vertex ids are only drawn for graphs up to this size
+    DRAW_BATCH = 500        # canvas items created per UI tick
+
     def __init__(self, root):
         self.root = root
+        self.job = None
+        self.cancel = threading.Event()  # replaced for every run; set to stop that run's worker
         self.root.title("Graph Coloring Visualization")
         self.root.configure(bg="#1e1e1e")
 
@@ -31,12 +53,19 @@ class GraphColoringVisualizer:
         # Algorithm selection dropdown
         tk.Label(input_frame, text="Algorithm:", fg="white", bg="#1e1e1e", font=("Helvetica", 12)).grid(row=0, column=6, padx=5)
         self.algorithm_var = tk.StringVar(value="Greedy")
-        self.algorithm_menu = tk.OptionMenu(input_frame, self.algorithm_var, "Greedy", "Backtracking")
+        self.algorithm_menu = tk.OptionMenu(input_frame, self.algorithm_var, "Greedy", "Welsh-Powell",
+                                            "Smallest-Last", "DSATUR", "Backtracking",
+                                            "Parallel Backtracking", "Exact")
         self.algorithm_menu.config(font=("Helvetica", 12), bg="#00ADB5", fg="white")
         self.algorithm_menu.grid(row=0, column=7, padx=5)
 
-        tk.Button(root, text="Start Visualization", command=self.start_visualization,
-                  bg="#00A9B5", fg="blue", font=("Helvetica", 12, "bold")).pack(pady=10)
+        button_frame = tk.Frame(root, bg="#1e1e1e")
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Load Edge List...", command=self.load_edge_file,
+                  bg="#00A9B5", fg="blue", font=("Helvetica", 12, "bold")).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Start Visualization", command=self.start_visualization,
+                  bg="#00A9B5", fg="blue", font=("Helvetica", 12, "bold")).pack(side="left", padx=5)
+        self.loaded_graph = None
 
         # Canvas for drawing graph
         self.canvas = tk.Canvas(root, width=900, height=500, bg="#2e2e2e", highlightthickness=0)
@@ -57,6 +86,21 @@ class GraphColoringVisualizer:
         # for icon, text, color in legends:
         #     tk.Label(legend_frame, text=f"{icon} {text}", fg=color, bg="#1e1e1e", font=("Helvetica", 11)).pack(side="left", padx=15)
 
+    def load_edge_file(self):
+        path = filedialog.askopenfilename(title="Edge list (one 'u v' pair per line)")
+        if not path:
+            return
+        try:
+            self.loaded_graph = CSRGraph.from_edge_list_file(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Input Error", f"Could not read edge list: {e}")
+            return
+        self.vertex_entry.delete(0, "end")
+        self.vertex_entry.insert(0, str(self.loaded_graph.n))
+        self.edge_entry.delete(0, "end")
+        self.result_label.config(text=f"Loaded {self.loaded_graph.n} vertices, "
+                                      f"{self.loaded_graph.num_edges} edges from file", fg="white")
+
     def start_visualization(self):
         self.canvas.delete("all")
         self.result_label.config(text="")
@@ -69,7 +113,9 @@ class GraphColoringVisualizer:
 
             edges_input = self.edge_entry.get().strip()
             edges = []
-            if edges_input:
+            if not edges_input and self.loaded_graph is not None and self.loaded_graph.n == n:
+                edges = self.loaded_graph
+            elif edges_input:
                 for e in edges_input.split(","):
                     parts = e.strip().split("-")
                     if len(parts) != 2:
@@ -85,149 +131,209 @@ class GraphColoringVisualizer:
             messagebox.showerror("Input Error", "Invalid input format for vertices, edges, or color count.")
             return
 
-        algorithm = self.algorithm_var.get().lower()  # "greedy" or "backtracking"
+        algorithm = self.algorithm_var.get().lower()  # a GREEDY_STRATEGIES key, "[parallel ]backtracking" or "exact"
         self.visualize_graph_coloring(n, edges, k, algorithm)
 
-    # Visualization code remains same
+    # Coloring and layout run on a worker thread; the UI polls it for progress
     def visualize_graph_coloring(self, n, edges, max_colors, algorithm="greedy"):
-        start_algo = perf_counter()
-        if algorithm == "backtracking":
-            coloring, steps = self.backtracking_coloring(n, edges, max_colors)
-        else:
-            coloring, steps = self.greedy_coloring(n, edges, max_colors)
-        end_algo = perf_counter()
-        algo_time = (end_algo - start_algo) * 1000.0
-        print(f"Algorithm time: {algo_time:.3f} ms, Steps: {steps}")
-
-        # Layout positions for nodes
-        radius = 180
-        center_x, center_y = 450, 250
-        self.node_positions = [
-            (center_x + radius * math.cos(2 * math.pi * i / n),
-             center_y + radius * math.sin(2 * math.pi * i / n)) for i in range(n)
-        ]
-
-        # Draw edges
-        for u, v in edges:
-            x1, y1 = self.node_positions[u]
-            x2, y2 = self.node_positions[v]
-            self.canvas.create_line(x1, y1, x2, y2, fill="#AAAAAA", width=2)
-
-        # Draw nodes
-        self.node_circles = []
-        for i, (x, y) in enumerate(self.node_positions):
-            circle = self.canvas.create_oval(x - 25, y - 25, x + 25, y + 25, fill="#808080", outline="white", width=2)
-            label = self.canvas.create_text(x, y, text=str(i), fill="white", font=("Helvetica", 14, "bold"))
-            self.node_circles.append((circle, label))
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.cancel.set()  # stop the previous run's worker
+        self.cancel = threading.Event()
+        graph = as_graph(n, edges)  # shared CSR adjacency, built once
+        messages = queue.Queue()
+        threading.Thread(target=self.compute_coloring, args=(graph, max_colors, algorithm, messages, self.cancel),
+                         daemon=True).start()
+        started = perf_counter()
+        status = "Coloring..."
+
+        def poll():
+            nonlocal status
+            while True:
+                try:
+                    kind, payload = messages.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "error":
+                    self.job = None
+                    self.result_label.config(text=f"⚠️ {payload}", fg="#FF0000")
+                    return
+                if kind == "done":
+                    self.job = None
+                    self.draw_graph(graph, max_colors, algorithm, *payload)
+                    return
+                status = payload
+            # Refreshed every tick so the elapsed time keeps moving during a long search
+            self.result_label.config(text=f"{status}  ({perf_counter() - started:.1f} s)", fg="white")
+            self.job = self.root.after(50, poll)
+
+        self.result_label.config(text=status, fg="white")
+        self.job = self.root.after(50, poll)
+
+    def compute_coloring(self, graph, max_colors, algorithm, messages, cancel):
+        # Runs off the UI thread: never touches Tk, only posts to messages; stops once cancel is set
+        try:
+            messages.put(("progress", f"Running {algorithm} coloring on {graph.n} vertices..."))
+            start_algo = perf_counter()
+            if algorithm == "backtracking":
+                coloring, steps = backtracking_coloring(graph, max_colors, cancel)
+            elif algorithm == "parallel backtracking":
+                coloring, steps = parallel_backtracking_coloring(graph, max_colors, self.TIME_BUDGET, cancel=cancel)
+            elif algorithm == "exact":
+                coloring, steps = exact_coloring(graph, cancel)
+            else:
+                coloring, steps = GREEDY_STRATEGIES[algorithm](graph, max_colors)
+            end_algo = perf_counter()
+            if cancel.is_set():
+                return
+            algo_time = (end_algo - start_algo) * 1000.0
+            print(f"Algorithm time: {algo_time:.3f} ms, Steps: {steps}")
+
+            def report(done, total):
+                messages.put(("progress", f"Computing layout: {100 * done // total}%"))
+
+            positions = force_directed_layout(graph, 900, 500, progress=report, cancel=cancel)
+            if cancel.is_set():
+                return
+            messages.put(("done", (coloring, steps, algo_time, positions)))
+        except Exception as e:  # surfaced in the result label instead of dying silently
+            messages.put(("error", f"{type(e).__name__}: {e}"))
+
+    def draw_graph(self, graph, max_colors, algorithm, coloring, steps, algo_time, positions):
+        n = graph.n
+        self.canvas.delete("all")
+        self.node_positions = positions
+
+        # Level of detail: thinner edges, smaller unlabeled vertices and sampled edges as graphs grow
+        all_edges = graph.num_edges
+        stride = max(1, -(-all_edges // self.MAX_DRAWN_EDGES))
+        edge_width = 2 if all_edges <= 200 else 1
+        r = max(3, min(25, int(25 * math.sqrt(20 / max(n, 1)))))
+        show_labels = n <= self.LABEL_LIMIT
+
+        chromatic = max(coloring, default=-1) + 1
+        if algorithm == "exact" and chromatic > max_colors:
+            # The exact solver always colors every vertex; show all of its colors
+            max_colors = chromatic
 
         base_palette = ["#FF6347", "#4682B4", "#32CD32", "#FFD700", "#DA70D6", "#FF8C00", "#00CED1", "#ADFF2F",
                         "#FF69B4", "#8A2BE2"]
         palette = base_palette[:max_colors] if max_colors <= len(base_palette) else (
             base_palette + ["#%06x" % (0x100000 + i) for i in range(max_colors - len(base_palette))])[:max_colors]
 
-        delay = 800  # ms per node
-        index = 0
         total_conflicts = sum(1 for c in coloring if c == -1)
+        edges = (e for i, e in enumerate(graph.edges()) if i % stride == 0)
+        self.node_circles = []
+        edge_note = f" (showing 1 in {stride} of {all_edges} edges)" if stride > 1 else ""
+
+        # Items are created DRAW_BATCH at a time so Tk keeps handling events
+        def draw_edges():
+            for _ in range(self.DRAW_BATCH):
+                edge = next(edges, None)
+                if edge is None:
+                    self.job = self.root.after(1, draw_nodes)
+                    return
+                u, v = edge
+                x1, y1 = positions[u]
+                x2, y2 = positions[v]
+                self.canvas.create_line(x1, y1, x2, y2, fill="#AAAAAA", width=edge_width)
+            self.job = self.root.after(1, draw_edges)
+
+        def draw_nodes():
+            start = len(self.node_circles)
+            for i in range(start, min(n, start + self.DRAW_BATCH)):
+                x, y = positions[i]
+                circle = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill="#808080",
+                                                 outline="white", width=2 if show_labels else 1)
+                label = None
+                if show_labels:
+                    label = self.canvas.create_text(x, y, text=str(i), fill="white", font=("Helvetica", 14, "bold"))
+                self.node_circles.append((circle, label))
+            if len(self.node_circles) < n:
+                self.job = self.root.after(1, draw_nodes)
+            else:
+                self.job = self.root.after(delay, animate_apply)
+
+        # Small graphs are animated one vertex at a time; large ones in batches
+        batch = max(1, n // 40)
+        delay = 800 if batch == 1 else 50  # ms per tick
+        index = 0
 
         def animate_apply():
             nonlocal index
             if index >= n:
+                self.job = None
                 used_colors = len({c for c in coloring if c != -1})
                 conflict_text = f" (conflicts: {total_conflicts})" if total_conflicts > 0 else ""
                 if conflict_text:
                     self.result_label.config(
                         text=(f"⚠️ Could not color using {max_colors} colors:{conflict_text}\n"
-                              f"⏱ Algorithm time: {algo_time:.3f} ms\n"),
+                              f"⏱ Algorithm time: {algo_time:.3f} ms{edge_note}\n"),
                         fg="#FF0000"
                     )
                 else:
-                    if algorithm == "backtracking":
+                    if algorithm == "exact":
                         self.result_label.config(
-                            text=(f"✅ Successfully colored using {used_colors} out of {max_colors} colors\n"
-                                  f"⏱ Algorithm time: {algo_time:.3f} ms\n"
+                            text=(f"✅ Optimal coloring with {used_colors} colors{edge_note}\n"
+                                  f"⏱ Algorithm time: {algo_time:.3f} ms, search nodes: {steps}\n"
                                   f"Chromatic Number: {used_colors}"),
                             fg="#00FF00"
                         )
+                    elif algorithm in ("backtracking", "parallel backtracking"):
+                        self.result_label.config(
+                            text=(f"✅ Successfully colored using {used_colors} out of {max_colors} colors{edge_note}\n"
+                                  f"⏱ Algorithm time: {algo_time:.3f} ms\n"
+                                  f"Note: backtracking only checks that {max_colors} colors suffice; "
+                                  f"use Exact for the chromatic number."),
+                            fg="#00FF00"
+                        )
                     else:
                         self.result_label.config(
-                            text=(f"✅ Colored using {used_colors} out of {max_colors} colors\n"
+                            text=(f"✅ Colored using {used_colors} out of {max_colors} colors{edge_note}\n"
                                 f"⏱ Algorithm time: {algo_time:.3f} ms\n"
                                 f"Warning: Greedy coloring does not guarantee minimal colors."),
                             fg="#00FF00"
                         )
                 return
 
-            circle, label = self.node_circles[index]
-            self.canvas.itemconfig(circle, fill="#FFA500")
-            self.root.update()
+            if batch == 1:
+                # Flash the current vertex orange before its color is applied
+                self.canvas.itemconfig(self.node_circles[index][0], fill="#FFA500")
+                self.root.update_idletasks()
 
-            assigned = coloring[index]
-            if assigned == -1:
-                self.canvas.itemconfig(circle, fill="#FF4444")
-            else:
-                color_hex = palette[assigned % len(palette)]
-                self.canvas.itemconfig(circle, fill=color_hex)
+            for i in range(index, min(n, index + batch)):
+                circle, label = self.node_circles[i]
+                assigned = coloring[i]
+                if assigned == -1:
+                    self.canvas.itemconfig(circle, fill="#FF4444")
+                else:
+                    color_hex = palette[assigned % len(palette)]
+                    self.canvas.itemconfig(circle, fill=color_hex)
 
-            index += 1
-            self.root.after(delay, animate_apply)
+            index += batch
+            self.job = self.root.after(delay, animate_apply)
 
-        self.root.after(delay, animate_apply)
+        draw_edges()
 
     #--------------------------------------------------------------
     # Backtracking algorithm
     def backtracking_coloring(self, n, edges, max_colors):
-        adjacency_list = {i: [] for i in range(n)}
-        for u, v in edges:
-            adjacency_list[u].append(v)
-            adjacency_list[v].append(u)
-
-        result = [-1] * n
-        steps = 0
-
-        def is_safe(v, c):
-            return all(result[neighbor] != c for neighbor in adjacency_list[v])
-
-        def solve(v):
-            nonlocal steps
-            if v == n:
-                return True
-            steps += 1
-            for c in range(max_colors):
-                if is_safe(v, c):
-                    result[v] = c
-                    if solve(v + 1):
-                        return True
-                    result[v] = -1
-            return False
-
-        solve(0)
-        return result, steps
+        return backtracking_coloring(as_graph(n, edges), max_colors)
 
     #--------------------------------------------------------------
     # Greedy algorithm
     def greedy_coloring(self, n, edges, max_colors):
-        adjacency = {i: [] for i in range(n)}
-        for u, v in edges:
-            adjacency[u].append(v)
-            adjacency[v].append(u)
-
-        result = [-1] * n
-        steps = 0
-        for u in range(n):
-            steps += 1
-            used = [False] * max_colors
-            # Mark colors of adjacent vertices as used
-            for v in adjacency[u]:
-                if result[v] != -1 and result[v] < max_colors:
-                    used[result[v]] = True
-            color = 0
-            while color < max_colors and used[color]:
-                color += 1
-            if color < max_colors:
-                result[u] = color
-            else:
-                result[u] = -1
-        return result, steps
+        return greedy_coloring(as_graph(n, edges), max_colors)
+
+
+# Greedy strategies offered by the GUI, keyed by lower-cased menu label
+GREEDY_STRATEGIES = {
+    "greedy": greedy_coloring,
+    "welsh-powell": welsh_powell_coloring,
+    "smallest-last": smallest_last_coloring,
+    "dsatur": dsatur_coloring,
+}
 
 #--------------------------------------------------------------
 if __name__ == "__main__":
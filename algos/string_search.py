@@ -0,0 +1,461 @@
+"""KMP string search without any GUI dependency.
+
+Single-pattern search (compiled patterns, byte DFA, streaming, batch and
+multi-process) and Aho-Corasick multi-pattern search. KMP.py visualizes it.
+"""
+import os
+from array import array
+from collections import OrderedDict, deque
+
+__all__ = [
+    "compute_lps", "KMPPattern", "LPSCache", "compile", "cache_info", "purge", "kmp_stream",
+    "kmp_search_bytes", "kmp_search_batch", "AhoCorasick", "kmp_parallel", "kmp_parallel_file",
+]
+
+
+def compute_lps(pattern):
+    lps = [0] * len(pattern)
+    length = 0
+    i = 1
+    while i < len(pattern):
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
+            else:
+                lps[i] = 0
+                i += 1
+    return lps
+
+
+# ---------------- COMPILED PATTERNS ----------------
+class KMPPattern:
+    """A pattern with its LPS table precomputed once, in the spirit of re.compile."""
+
+    __slots__ = ("pattern", "lps", "_dfa")
+
+    def __init__(self, pattern):
+        if not pattern:
+            raise ValueError("pattern must not be empty")
+        self.pattern = pattern
+        self.lps = array("i", compute_lps(pattern))
+        self._dfa = None
+
+    @property
+    def dfa(self):
+        """Byte-alphabet KMP automaton, built on first use (bytes patterns only).
+
+        Row j holds the next state for each of the 256 byte values. States are
+        stored pre-multiplied by 256 so that a transition is dfa[state + byte].
+        """
+        if self._dfa is None:
+            if not isinstance(self.pattern, (bytes, bytearray)):
+                raise TypeError("the DFA mode needs a bytes pattern")
+            pattern, lps = self.pattern, self.lps
+            m = len(pattern)
+            dfa = array("i", bytes(4 * 256 * m))
+            for j in range(m):
+                row = j * 256
+                if j:
+                    fallback = lps[j - 1] * 256
+                    dfa[row:row + 256] = dfa[fallback:fallback + 256]
+                dfa[row + pattern[j]] = (j + 1) * 256
+            self._dfa = dfa
+        return self._dfa
+
+    def search_bytes(self, data, offset=0, state=0):
+        """Return (matches, state) for a bytes-like buffer using one table lookup per byte.
+
+        data may be any buffer (bytes, bytearray, mmap, memoryview slice); it is
+        scanned through a memoryview without copying. offset is added to every
+        reported match and state lets callers resume a previous scan.
+        """
+        dfa = self.dfa
+        m = len(self.pattern)
+        accept = m * 256
+        restart = self.lps[m - 1] * 256
+        state *= 256
+        matches = []
+        for i, byte in enumerate(memoryview(data).cast("B")):
+            state = dfa[state + byte]
+            if state == accept:
+                matches.append(offset + i - m + 1)
+                state = restart
+        return matches, state // 256
+
+    def __repr__(self):
+        return f"KMPPattern({self.pattern!r})"
+
+    def search(self, text):
+        """Return (matches, comparisons) exactly like KMPVisualizer.kmp_algorithm."""
+        pattern, lps = self.pattern, self.lps
+        n, m = len(text), len(pattern)
+        i = j = comparisons = 0
+        matches = []
+
+        while i < n:
+            comparisons += 1
+
+            if text[i] == pattern[j]:
+                i += 1
+                j += 1
+
+            if j == m:
+                matches.append(i - j)
+                j = lps[j - 1]  # continue searching
+
+            elif i < n and text[i] != pattern[j]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+
+        return matches, comparisons
+
+    def trace(self, text):
+        """Yield the steps of search as events for replay.
+
+        ("match", i, j) and ("mismatch", i, j) are emitted for every comparison
+        of text[i] with pattern[j], and ("found", start, m) for every match.
+        """
+        pattern, lps = self.pattern, self.lps
+        n, m = len(text), len(pattern)
+        i = j = 0
+
+        while i < n:
+            if text[i] == pattern[j]:
+                yield "match", i, j
+                i += 1
+                j += 1
+
+            if j == m:
+                yield "found", i - j, m
+                j = lps[j - 1]
+
+            elif i < n and text[i] != pattern[j]:
+                yield "mismatch", i, j
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+
+    def finditer(self, text):
+        pattern, lps = self.pattern, self.lps
+        m = len(pattern)
+        j = 0
+        for i, ch in enumerate(text):
+            while j and ch != pattern[j]:
+                j = lps[j - 1]
+            if ch == pattern[j]:
+                j += 1
+                if j == m:
+                    yield i - m + 1
+                    j = lps[j - 1]
+
+
+class LPSCache:
+    """Bounded LRU cache of compiled patterns with hit/miss counters."""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, pattern):
+        compiled = self._entries.get(pattern)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(pattern)
+            return compiled
+
+        self.misses += 1
+        compiled = KMPPattern(pattern)
+        self._entries[pattern] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+_cache = LPSCache()
+
+
+def compile(pattern):
+    """Return the cached KMPPattern for pattern, building it on first use."""
+    return _cache.get(pattern)
+
+
+def cache_info():
+    return _cache.info()
+
+
+def purge():
+    _cache.clear()
+
+
+# ---------------- STREAMING SEARCH ----------------
+def _iter_chunks(source, chunk_size):
+    """Yield byte chunks from a path, a buffer, a file/mmap object or an iterable of chunks."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _iter_chunks(f, chunk_size)
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+        return
+
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            if isinstance(chunk, str):  # file opened in text mode
+                chunk = chunk.encode()
+            yield chunk
+
+    for chunk in source:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        yield chunk
+
+
+def kmp_stream(source, pattern, chunk_size=1 << 16):
+    """Yield absolute byte offsets of pattern in source, reading it chunk by chunk.
+
+    Only one chunk is held in memory at a time; the KMP state j is carried
+    across chunk boundaries so matches spanning two chunks are still found.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    if not pattern:
+        raise ValueError("pattern must not be empty")
+
+    compiled = compile(pattern)
+    j = 0
+    offset = 0
+
+    for chunk in _iter_chunks(source, chunk_size):
+        matches, j = compiled.search_bytes(chunk, offset, j)
+        yield from matches
+        offset += len(chunk)
+
+
+def kmp_search_bytes(data, pattern):
+    """Return the match offsets of a bytes pattern in a bytes-like buffer (DFA mode)."""
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    return compile(pattern).search_bytes(data)[0]
+
+
+# ---------------- BATCH SEARCH ----------------
+def kmp_search_batch(texts, pattern):
+    """Return the list of match offsets for every record in texts.
+
+    Records that cannot contain the pattern are rejected by a length check and
+    a substring test, both of which run in C, before the shared compiled
+    pattern runs the KMP loop on the remaining candidates.
+    """
+    compiled = compile(pattern)
+    finditer = compiled.finditer
+    m = len(pattern)
+    results = []
+    for text in texts:
+        if len(text) < m or pattern not in text:
+            results.append([])
+        else:
+            results.append(list(finditer(text)))
+    return results
+
+
+# ---------------- MULTI-PATTERN SEARCH ----------------
+class AhoCorasick:
+    """Aho-Corasick automaton: the LPS failure function generalised to a trie.
+
+    Every pattern is reported as (pattern_id, offset) in a single pass over
+    the text, where pattern_id is the pattern's index in the input list.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("patterns must not be empty")
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = nxt
+            self.output[state].append(pid)
+
+        # Breadth-first, like compute_lps walking the pattern left to right:
+        # the failure link of a state is the longest proper suffix of its
+        # string that is also a path in the trie.
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def finditer(self, text):
+        goto, fail, output = self.goto, self.fail, self.output
+        lengths = [len(p) for p in self.patterns]
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in output[state]:
+                yield pid, i - lengths[pid] + 1
+
+    def search(self, text):
+        return list(self.finditer(text))
+
+
+# ---------------- PARALLEL SEARCH ----------------
+def _entry_state(segment, compiled, start):
+    """KMP state j at the first loop iteration of KMPPattern.search with i == start.
+
+    It only depends on the len(pattern) characters before start and on the
+    character at start, so a worker can recover it from the chunk overlap.
+    """
+    pattern, lps = compiled.pattern, compiled.lps
+    m = len(pattern)
+    if start == 0:
+        return 0
+    if start >= m and segment[start - m:start] == pattern:
+        return lps[m - 1]  # a match ended just before start
+
+    k = 0
+    for ch in segment[max(0, start - m + 1):start]:
+        while k and ch != pattern[k]:
+            k = lps[k - 1]
+        if ch == pattern[k]:
+            k += 1
+    if k == 0:
+        return 0
+    # The serial loop peeks at text[start] right after advancing to it
+    return k if segment[start] == pattern[k] else lps[k - 1]
+
+
+def _scan_segment(segment, pattern, base, start, end):
+    """Run the serial KMP loop for iterations with start <= i < end (segment-local)."""
+    compiled = compile(pattern)
+    lps = compiled.lps
+    n, m = len(segment), len(pattern)
+    i, j = start, _entry_state(segment, compiled, start)
+    comparisons = 0
+    matches = []
+
+    while i < end:
+        comparisons += 1
+
+        if segment[i] == pattern[j]:
+            i += 1
+            j += 1
+
+        if j == m:
+            matches.append(base + i - j)
+            j = lps[j - 1]
+
+        elif i < n and segment[i] != pattern[j]:
+            if j != 0:
+                j = lps[j - 1]
+            else:
+                i += 1
+
+    return matches, comparisons
+
+
+def _search_text_chunk(task):
+    segment, pattern, base, start, end = task
+    return _scan_segment(segment, pattern, base, start, end)
+
+
+def _search_file_chunk(task):
+    path, pattern, base, start, end, length = task
+    with open(path, "rb") as f:
+        f.seek(base)
+        segment = f.read(length)
+    return _scan_segment(segment, pattern, base, start, end)
+
+
+def _chunk_bounds(n, m, chunk_size):
+    """Yield (lo, hi, start, end): chunk [start, end) plus its overlap window [lo, hi)."""
+    for start in range(0, n, chunk_size):
+        end = min(start + chunk_size, n)
+        lo = max(0, start - m)
+        hi = min(n, end + 1)
+        yield lo, hi, start, end
+
+
+def _merge(results):
+    # Every loop iteration belongs to exactly one chunk, so matches from
+    # consecutive chunks are already sorted and never overlap.
+    matches = []
+    comparisons = 0
+    for chunk_matches, chunk_comparisons in results:
+        matches.extend(chunk_matches)
+        comparisons += chunk_comparisons
+    return matches, comparisons
+
+
+def kmp_parallel(text, pattern, chunk_size=1 << 20, workers=None):
+    """Search text on a process pool; returns the same (matches, comparisons) as kmp_algorithm."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    compiled = compile(pattern)
+    if len(text) <= chunk_size:
+        return compiled.search(text)
+
+    m = len(pattern)
+    tasks = [(text[lo:hi], pattern, lo, start - lo, end - lo)
+             for lo, hi, start, end in _chunk_bounds(len(text), m, chunk_size)]
+    from concurrent.futures import ProcessPoolExecutor  # deferred: slow to import
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _merge(pool.map(_search_text_chunk, tasks))
+
+
+def kmp_parallel_file(path, pattern, chunk_size=1 << 24, workers=None):
+    """Like kmp_parallel, but each worker reads its own chunk of the file at path."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    compile(pattern)
+
+    m = len(pattern)
+    tasks = [(path, pattern, lo, start - lo, end - lo, hi - lo)
+             for lo, hi, start, end in _chunk_bounds(os.path.getsize(path), m, chunk_size)]
+    from concurrent.futures import ProcessPoolExecutor  # deferred: slow to import
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _merge(pool.map(_search_file_chunk, tasks))
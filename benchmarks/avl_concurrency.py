@@ -0,0 +1,78 @@
+"""Read throughput of ConcurrentAVLTree against one global lock around AVLTree.
+
+Each configuration runs reader threads doing random lookups while one writer
+thread keeps inserting. Run from the repository root:
+
+    python -m benchmarks.avl_concurrency [keys] [seconds]
+
+Under CPython's GIL the lock-free readers do not run in parallel, but they no
+longer queue behind the writer or each other.
+"""
+import random
+import sys
+import threading
+from time import perf_counter
+
+from algos.avl_tree import AVLTree, ConcurrentAVLTree
+
+
+class GlobalLockAVL:
+    """Baseline: every call serialised on one lock."""
+
+    def __init__(self, keys):
+        self.tree = AVLTree()
+        self.lock = threading.Lock()
+        self.root = self.tree.fromKeys(keys)
+
+    def insert(self, key):
+        with self.lock:
+            self.root = self.tree.insert(self.root, key)
+
+    def contains(self, key):
+        with self.lock:
+            return self.tree.contains(self.root, key)
+
+
+def run(index, readers, seconds, key_space):
+    stop = threading.Event()
+    counts = [0] * readers
+
+    def reader(slot):
+        rnd = random.Random(slot)
+        done = 0
+        while not stop.is_set():
+            for _ in range(100):
+                index.contains(rnd.randrange(key_space))
+            done += 100
+        counts[slot] = done
+
+    def writer():
+        rnd = random.Random(-1)
+        while not stop.is_set():
+            index.insert(rnd.randrange(key_space))
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    start = perf_counter()
+    for t in threads:
+        t.start()
+    stop.wait(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts) / (perf_counter() - start)
+
+
+def main(n, seconds):
+    keys = random.sample(range(n * 4), n)
+    print(f"{n} keys, {seconds}s per run, 1 writer")
+    print(f"{'readers':>8} {'global lock (reads/s)':>24} {'concurrent (reads/s)':>24}")
+    for readers in (1, 2, 4, 8):
+        locked = run(GlobalLockAVL(keys), readers, seconds, n * 4)
+        concurrent = run(ConcurrentAVLTree(keys), readers, seconds, n * 4)
+        print(f"{readers:>8} {locked:>24,.0f} {concurrent:>24,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 1.0)
@@ -0,0 +1,50 @@
+"""Cost of path copying: PersistentAVLTree against the in-place AVLTree.
+
+Run from the repository root:  python -m benchmarks.avl_persistent [n]
+"""
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+from algos.avl_tree import AVLTree, PersistentAVLTree
+
+
+def build(tree, keys):
+    root = None
+    start = perf_counter()
+    for k in keys:
+        root = tree.insert(root, k)
+    return root, (perf_counter() - start) * 1000
+
+
+def retained_bytes(tree, keys):
+    """Bytes still allocated after building the final version only."""
+    tracemalloc.start()
+    root, _ = build(tree, keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, root
+
+
+def main(n):
+    keys = random.sample(range(n * 10), n)
+
+    _, mutable_ms = build(AVLTree(), keys)
+    persistent = PersistentAVLTree()
+    _, persistent_ms = build(persistent, keys)
+
+    mutable_bytes, _ = retained_bytes(AVLTree(), keys)
+    persistent_bytes, _ = retained_bytes(PersistentAVLTree(), keys)
+
+    print(f"Inserted {n} keys")
+    print(f"  Mutable AVL:     {mutable_ms:.1f} ms ({mutable_ms * 1000 / n:.2f} us/insert)")
+    print(f"  Persistent AVL:  {persistent_ms:.1f} ms ({persistent_ms * 1000 / n:.2f} us/insert)")
+    print(f"  Slowdown:        {persistent_ms / mutable_ms:.2f}x")
+    print(f"  Nodes copied:    {persistent.copies / n:.1f} per insert")
+    print(f"  Live memory:     {mutable_bytes / n:.0f} vs {persistent_bytes / n:.0f} bytes/key "
+          f"(old versions are garbage unless a snapshot holds them)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,77 @@
+import itertools
+import random
+
+import pytest
+
+from algos.coloring import CSRGraph, DynamicColoring, exact_coloring, parallel_backtracking_coloring
+
+
+def brute_force_chromatic(n, edges):
+    for k in range(1, n + 1):
+        for colors in itertools.product(range(k), repeat=n):
+            if all(colors[u] != colors[v] for u, v in edges):
+                return k
+    return 0
+
+
+def random_edges(rnd, n, p):
+    return [(u, v) for u in range(n) for v in range(u + 1, n) if rnd.random() < p]
+
+
+def test_exact_coloring_matches_brute_force():
+    rnd = random.Random(575)
+    for _ in range(200):
+        n = rnd.randint(1, 7)
+        edges = random_edges(rnd, n, rnd.choice((0.2, 0.5, 0.8)))
+        coloring, _ = exact_coloring(CSRGraph.from_edges(n, edges))
+        assert all(coloring[u] != coloring[v] for u, v in edges)
+        assert max(coloring) + 1 == brute_force_chromatic(n, edges)
+
+
+def test_exact_coloring_long_odd_cycle():
+    n = 1201  # deeper than the default recursion limit
+    coloring, _ = exact_coloring(CSRGraph.from_edges(n, [(i, (i + 1) % n) for i in range(n)]))
+    assert max(coloring) + 1 == 3
+    assert all(coloring[i] != coloring[(i + 1) % n] for i in range(n))
+
+
+def test_parallel_backtracking_long_path():
+    n = 3000  # deeper than the default recursion limit
+    graph = CSRGraph.from_edges(n, [(i, i + 1) for i in range(n - 1)])
+    coloring, _ = parallel_backtracking_coloring(graph, 3, time_budget=5, workers=2)
+    assert min(coloring) >= 0
+    assert all(coloring[i] != coloring[i + 1] for i in range(n - 1))
+
+
+def test_dynamic_coloring_reuses_colors_after_removal():
+    dynamic = DynamicColoring(3, [(0, 1), (1, 2), (0, 2)])
+    dynamic.remove_vertex(next(v for v, c in dynamic.color.items() if c == 1))
+    dynamic.add_vertex(4)
+    dynamic.add_edge(3, 4)
+    assert dynamic.is_proper()
+    assert dynamic.num_colors == 2
+
+
+def test_dynamic_coloring_stays_proper():
+    rnd = random.Random(23)
+    dynamic = DynamicColoring(30)
+    for _ in range(2000):
+        u, v = rnd.sample(range(30), 2)
+        if rnd.random() < 0.6:
+            dynamic.add_edge(u, v)
+        elif rnd.random() < 0.9:
+            dynamic.remove_edge(u, v)
+        elif u in dynamic.adj:
+            dynamic.remove_vertex(u)
+        else:
+            dynamic.add_vertex(u)
+        assert dynamic.is_proper()
+
+
+def test_edge_list_file_negative_id(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("0-1\n2, 3  # comment\n")
+    assert list(CSRGraph.from_edge_list_file(path).edges()) == [(0, 1), (2, 3)]
+    path.write_text("0 1\n3 -1\n")
+    with pytest.raises(ValueError, match="out of range"):
+        CSRGraph.from_edge_list_file(path)
@@ -0,0 +1,9 @@
+from algos.string_search import kmp_stream
+
+
+def test_kmp_stream_text_mode_file(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_bytes("abc xyz\nhéllo x\n".encode())
+    with open(path, encoding="utf-8") as f:
+        from_text = list(kmp_stream(f, "x", chunk_size=3))
+    assert from_text == list(kmp_stream(path, "x", chunk_size=3)) == [4, 15]